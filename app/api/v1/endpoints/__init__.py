@@ -1 +1,14 @@
-from . import authorization, partners, products, sales
+from . import (
+    admin,
+    aggregates,
+    authorization,
+    batch,
+    cache,
+    changes,
+    export,
+    partners,
+    products,
+    sales,
+    search,
+    stream,
+)
@@ -0,0 +1,80 @@
+"""Administration endpoints."""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from ....core.config import settings
+from ....core.metrics import TimedRoute
+from ....core.profiler import (
+    ProfileMode,
+    ProfilerBusy,
+    ProfilerUnavailable,
+    ProfileSession,
+    profiler,
+)
+from ....core.security import get_current_admin
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_admin)])
+
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile(
+    mode: ProfileMode = "wall",
+    seconds: float = Query(10.0, gt=0),
+    requests: Optional[int] = Query(
+        None, ge=1, description="Stop after this many matching requests"
+    ),
+    path: Optional[str] = Query(
+        None, description="Only sample requests whose path starts with this"
+    ),
+    interval: float = Query(0.005, ge=0.001, le=1.0),
+) -> PlainTextResponse:
+    """
+    Profile the worker handling this request.
+
+    Samples stacks every ``interval`` seconds, of wall-clock time for every
+    thread in ``wall`` mode or of CPU time for the event loop in ``cpu``
+    mode, for ``seconds``. With ``requests``, only requests whose path starts
+    with ``path`` (by default every API request) are sampled, and profiling
+    stops early once that many of them completed. Only the worker process
+    serving this request is profiled.
+
+    Args:
+        mode: ``wall`` or ``cpu``
+        seconds: How long to profile, at most ``profile_max_seconds``
+        requests: Number of matching requests to profile
+        path: Path prefix of the requests to profile
+        interval: Sampling interval in seconds
+
+    Returns:
+        PlainTextResponse: Collapsed stacks, one ``frame;frame;... count``
+            line each, ready for flamegraph.pl or speedscope
+
+    Raises:
+        HTTPException: If a profiling session is already running or the mode
+            isn't available
+    """
+    if seconds > settings.profile_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiling is limited to {settings.profile_max_seconds} seconds",
+        )
+    if requests is not None and path is None:
+        path = settings.api_v1_prefix
+
+    session = ProfileSession(mode, interval, path, requests)
+    try:
+        stacks = await profiler.profile(session, seconds)
+    except ProfilerBusy as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ProfilerUnavailable as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return PlainTextResponse(
+        stacks,
+        headers={
+            "X-Profile-Samples": str(sum(session.samples.values())),
+            "X-Profile-Requests": str(session.completed),
+        },
+    )
@@ -0,0 +1,148 @@
+"""Aggregation endpoints backed by Odoo's read_group."""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ....core.constants import AGGREGATES
+from ....core.filters import RecordFilter, parse_order
+from ....core.metrics import TimedRoute
+from ....core.security import get_current_user
+from ....services.odoo import odoo
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+AGGREGATE_FUNCTIONS = {"sum", "avg", "min", "max", "count_distinct"}
+
+DATE_GRANULARITIES = {"day", "week", "month", "quarter", "year"}
+
+# Keys of read_group rows that only matter to Odoo's own UI.
+INTERNAL_KEYS = {"__domain", "__range", "__context", "__fold"}
+
+
+def parse_groupby(
+    groupby: str, allowed: List[str], meta: Dict[str, Dict[str, Any]]
+) -> List[str]:
+    """
+    Validate group-by terms such as ``state`` or ``date_order:month``.
+
+    Raises:
+        HTTPException: If a field isn't groupable or a granularity is misused
+    """
+    terms = []
+    for term in filter(None, (t.strip() for t in groupby.split(","))):
+        field, _, granularity = term.partition(":")
+        if field not in allowed:
+            raise HTTPException(
+                status_code=400, detail=f"Grouping by {field} is not allowed"
+            )
+        if granularity:
+            if meta.get(field, {}).get("type") not in ("date", "datetime"):
+                raise HTTPException(
+                    status_code=400, detail=f"{field} is not a date field"
+                )
+            if granularity not in DATE_GRANULARITIES:
+                raise HTTPException(
+                    status_code=400, detail=f"Invalid granularity: {granularity}"
+                )
+        terms.append(term)
+    if not terms:
+        raise HTTPException(status_code=400, detail="groupby is required")
+    return terms
+
+
+def parse_measures(measures: str, allowed: List[str]) -> List[str]:
+    """
+    Translate measures such as ``amount_total:sum`` into read_group fields.
+
+    Each measure is aliased as ``<field>_<function>`` so the same field can
+    be aggregated several ways.
+
+    Raises:
+        HTTPException: If a field or aggregate function isn't allowed
+    """
+    specs = []
+    for term in filter(None, (t.strip() for t in measures.split(","))):
+        field, _, function = term.partition(":")
+        function = function or "sum"
+        if field not in allowed:
+            raise HTTPException(
+                status_code=400, detail=f"Aggregating {field} is not allowed"
+            )
+        if function not in AGGREGATE_FUNCTIONS:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid aggregate function: {function}"
+            )
+        specs.append(f"{field}_{function}:{function}({field})")
+    return specs
+
+
+@router.get("/{resource}", response_model=List[Dict[str, Any]])
+async def get_aggregates(
+    resource: str,
+    groupby: str = Query(
+        ..., description="Comma-separated fields, e.g. state,date_order:month"
+    ),
+    measures: str = Query(
+        "", description="Comma-separated field:function, e.g. amount_total:sum"
+    ),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Maximum number of groups"
+    ),
+    query: RecordFilter = Depends(),
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate sale orders or sale order lines in Odoo.
+
+    Groups are computed by Odoo's ``read_group``, so only one row per group
+    is transferred instead of every matching record. Date fields can be
+    grouped by ``day``, ``week``, ``month``, ``quarter`` or ``year``.
+
+    Args:
+        resource: ``sales`` or ``sale-lines``
+        groupby: Fields to group by
+        measures: Aggregates to compute; the function defaults to ``sum``
+        limit: Maximum number of groups to return
+        query: Filter applied before grouping, and the order of the groups
+            (by group-by fields, measure aliases or ``count``)
+
+    Returns:
+        List[Dict]: One row per group with its group-by values, a ``count``
+        of records and each measure under ``<field>_<function>``
+
+    Raises:
+        HTTPException: If the resource is unknown, a parameter is invalid or
+            there's an error aggregating in Odoo
+    """
+    if resource not in AGGREGATES:
+        raise HTTPException(status_code=404, detail="Unknown resource")
+    model, groupable, measurable = AGGREGATES[resource]
+
+    meta = await odoo.fields_get(model)
+    groups = parse_groupby(groupby, groupable, meta)
+    specs = parse_measures(measures, measurable)
+
+    orderby = None
+    if query.order_by:
+        aliases = [spec.partition(":")[0] for spec in specs]
+        orderable = [g.partition(":")[0] for g in groups] + aliases + ["count"]
+        terms = parse_order(query.order_by, orderable).split(", ")
+        orderby = ", ".join(re.sub(r"^count ", "__count ", term) for term in terms)
+
+    rows = await odoo.read_group(
+        model,
+        domain=await query.domain(model),
+        fields=specs,
+        groupby=groups,
+        orderby=orderby,
+        limit=limit,
+    )
+    return [
+        {
+            ("count" if key == "__count" else key): value
+            for key, value in row.items()
+            if key not in INTERNAL_KEYS
+        }
+        for row in rows
+    ]
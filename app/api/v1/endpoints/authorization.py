@@ -1,15 +1,34 @@
 """Authentication endpoints."""
 
+import math
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 
-from ....core.security import ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token
+from ....core.config import settings
+from ....core.metrics import TimedRoute
+from ....core.ratelimit import SlidingWindowLimiter
+from ....core.security import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    create_access_token,
+    credential_cache,
+    get_current_user,
+    oauth2_scheme,
+    revoke_token,
+)
 from ....services.odoo import odoo
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+
+# Only logins that have to be checked by Odoo count against these limits.
+user_login_limiter = SlidingWindowLimiter(
+    limit=settings.login_user_limit, window=settings.login_window
+)
+ip_login_limiter = SlidingWindowLimiter(
+    limit=settings.login_ip_limit, window=settings.login_window
+)
 
 
 class Token(BaseModel):
@@ -21,20 +40,58 @@ class Token(BaseModel):
 
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Token:
-    """Authenticate user and return JWT token."""
-    try:
-        odoo.authenticate(form_data.username, form_data.password)
-    except HTTPException as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
+    """
+    Authenticate user and return JWT token.
+
+    Credentials that passed Odoo authentication recently are accepted from
+    the credential cache. Other attempts are throttled per username and per
+    client IP before being checked by Odoo.
+    """
+    username, password = form_data.username, form_data.password
+    if not credential_cache.verify(username, password):
+        client_ip = request.client.host if request.client else "unknown"
+        # Both limits are checked before either records the attempt, so a
+        # blocked attempt doesn't use up the other limit.
+        retry_after = max(
+            user_login_limiter.check(username) or 0,
+            ip_login_limiter.check(client_ip) or 0,
         )
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        user_login_limiter.hit(username)
+        ip_login_limiter.hit(client_ip)
+
+        try:
+            await odoo.authenticate(username, password)
+        except HTTPException as e:
+            if e.status_code != status.HTTP_401_UNAUTHORIZED:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect username or password",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        credential_cache.store(username, password)
 
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": form_data.username}, expires_delta=access_token_expires
+        data={"sub": username}, expires_delta=access_token_expires
     )
     return Token(access_token=access_token, token_type="bearer")
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(get_current_user)],
+)
+async def logout(token: str = Depends(oauth2_scheme)) -> None:
+    """Revoke the JWT token used for this request."""
+    revoke_token(token)
@@ -0,0 +1,193 @@
+"""Batch endpoint executing many reads in one HTTP call."""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ....core.config import settings
+from ....core.metrics import TimedRoute
+from ....core.responses import RawJSONResponse
+from ....core.security import get_current_user
+from ....schemas.batch import BatchRequest, SubRequest, SubResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+# Resources reachable from a batch. Streams and exports never complete
+# within a single response and are left out.
+BATCHABLE_RESOURCES = {
+    "partners",
+    "products",
+    "sales",
+    "search",
+    "aggregates",
+    "changes",
+}
+
+# Sub-request headers replaced by those of the batch request itself.
+RESERVED_HEADERS = {"authorization", "host", "content-length", "accept-encoding"}
+
+Result = Tuple[int, Dict[str, str], bytes]
+
+# Result of a sub-request that raised, as the server would have answered it.
+INTERNAL_ERROR: Result = (
+    status.HTTP_500_INTERNAL_SERVER_ERROR,
+    {"content-type": "application/json"},
+    b'{"detail":"Internal Server Error"}',
+)
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _sub_request_key(sub_request: SubRequest) -> Tuple:
+    headers = {name.lower(): value for name, value in sub_request.headers.items()}
+    return (sub_request.path, tuple(sorted(headers.items())))
+
+
+async def dispatch(request: Request, sub_request: SubRequest) -> Result:
+    """
+    Run one GET sub-request through the application in process.
+
+    The sub-request goes through the same middleware, dependencies and
+    endpoints as a regular call, with the batch request's credentials. An
+    unhandled error is logged and becomes a 500 result; the server error
+    middleware re-raises it after answering, which would otherwise fail the
+    whole batch.
+
+    Returns:
+        Tuple: Status code, response headers and raw body
+    """
+    url = urlsplit(sub_request.path)
+    path = settings.api_v1_prefix + "/" + url.path.lstrip("/")
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in sub_request.headers.items()
+        if name.lower() not in RESERVED_HEADERS
+    ]
+    headers += [
+        (name, value)
+        for name, value in request.scope["headers"]
+        if name in (b"authorization", b"host")
+    ]
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": url.query.encode(),
+        "headers": headers,
+    }
+    if "state" in request.scope:
+        scope["state"] = request.scope["state"]
+
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    status_code = 500
+    response_headers: Dict[str, str] = {}
+    body = bytearray()
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for name, value in message.get("headers", []):
+                response_headers[name.decode("latin-1")] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception:
+        logger.exception("Batch sub-request failed: GET %s", sub_request.path)
+        return INTERNAL_ERROR
+    response_headers.pop("content-length", None)
+    return status_code, response_headers, bytes(body)
+
+
+def is_json(content_type: str) -> bool:
+    """Tell whether a media type is JSON, including ``+json`` types."""
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+def encode_result(sub_request: SubRequest, result: Result) -> bytes:
+    """
+    Encode one batch result, embedding a JSON body as is.
+
+    Sub-responses are already encoded, so their bodies are spliced into the
+    output rather than decoded and encoded again.
+    """
+    status_code, headers, body = result
+    envelope = json.dumps(
+        {"id": sub_request.id, "status": status_code, "headers": headers}
+    ).encode()
+    if not body:
+        body = b"null"
+    elif not is_json(headers.get("content-type", "")):
+        body = json.dumps(body.decode("utf-8", "replace")).encode()
+    return envelope[:-1] + b', "body": ' + body + b"}"
+
+
+@router.post("", response_model=List[SubResponse])
+async def run_batch(request: Request, batch: BatchRequest) -> RawJSONResponse:
+    """
+    Execute several reads in one call.
+
+    Each sub-request is a GET of an existing resource, e.g.
+    ``/partners/7`` or ``/products?filter=list_price>10``. They run
+    concurrently; identical sub-requests run once and share their result,
+    and identical Odoo reads across different sub-requests are coalesced by
+    OdooService. A failing sub-request only fails its own result.
+
+    Args:
+        request: The batch request, whose credentials are used for every read
+        batch: The sub-requests to execute
+
+    Returns:
+        List[SubResponse]: One result per sub-request, in request order
+
+    Raises:
+        HTTPException: If the batch is too large or a path is not batchable
+    """
+    if len(batch.requests) > settings.batch_max_requests:
+        raise _bad_request(
+            f"A batch holds at most {settings.batch_max_requests} requests"
+        )
+    for sub_request in batch.requests:
+        segments = urlsplit(sub_request.path).path.strip("/").split("/")
+        if segments[0] not in BATCHABLE_RESOURCES:
+            raise _bad_request(f"Path can't be batched: {sub_request.path}")
+
+    unique: Dict[Tuple, SubRequest] = {}
+    for sub_request in batch.requests:
+        unique.setdefault(_sub_request_key(sub_request), sub_request)
+    results = await asyncio.gather(
+        *(dispatch(request, sub_request) for sub_request in unique.values())
+    )
+    results_by_key = dict(zip(unique, results))
+
+    body = b",".join(
+        encode_result(sub_request, results_by_key[_sub_request_key(sub_request)])
+        for sub_request in batch.requests
+    )
+    return RawJSONResponse(b"[" + body + b"]")
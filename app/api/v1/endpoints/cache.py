@@ -0,0 +1,34 @@
+"""Cache management endpoints."""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, status
+
+from ....core.metrics import TimedRoute
+from ....core.security import get_current_user
+from ....services.odoo import odoo
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+
+@router.get("")
+async def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get read cache statistics.
+
+    Returns:
+        dict: Backend counters and the configured TTL per Odoo model
+    """
+    return {"ttls": odoo.cache_ttls, **odoo.cache.stats()}
+
+
+@router.delete("", status_code=status.HTTP_204_NO_CONTENT)
+async def invalidate_cache(model: Optional[str] = None) -> None:
+    """
+    Invalidate cached Odoo reads.
+
+    Args:
+        model: Odoo model to invalidate, e.g. ``product.template``.
+            Everything is invalidated when omitted.
+    """
+    odoo.invalidate_cache(model)
@@ -0,0 +1,85 @@
+"""Incremental change feed endpoints."""
+
+from functools import partial
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ....core.constants import RESOURCES
+from ....core.metrics import TimedRoute
+from ....core.pagination import (
+    decode_cursor,
+    encode_cursor,
+    fetch_after,
+    parse_position,
+)
+from ....core.responses import flatten
+from ....core.security import get_current_user
+from ....schemas.changes import ChangeFeed
+from ....services.odoo import odoo
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+
+@router.get("/{resource}", response_model=ChangeFeed)
+async def get_changes(
+    resource: str,
+    since: Optional[str] = Query(
+        None, description="Watermark returned by the previous call"
+    ),
+    limit: int = Query(100, ge=1, le=1000),
+) -> ChangeFeed:
+    """
+    Get records changed since a watermark.
+
+    Records are returned in ``write_date`` order, starting right after the
+    watermark, which makes each call cost proportional to the number of
+    changes rather than to the size of the table. Records written within
+    the same second are returned by id, and a page may then hold fewer than
+    ``limit`` records while ``has_more`` is set. Without ``since`` the feed
+    starts from the oldest record, which doubles as the initial full sync.
+    Deleted records don't appear in the feed. Many2one values are returned
+    as the related record's id.
+
+    Args:
+        resource: One of ``partners``, ``products``, ``sales`` or ``sale-lines``
+        since: Watermark returned as ``next_watermark`` by the previous call
+        limit: Maximum number of records to return (default: 100)
+
+    Returns:
+        ChangeFeed: The changed records and the watermark to continue from
+
+    Raises:
+        HTTPException: If the resource is unknown, the watermark is invalid or
+            there's an error fetching from Odoo
+    """
+    if resource not in RESOURCES:
+        raise HTTPException(status_code=404, detail="Unknown resource")
+    model, fields = RESOURCES[resource]
+
+    after = None
+    if since:
+        after = parse_position("write_date", decode_cursor(since))
+
+    records, position, has_more = await fetch_after(
+        partial(
+            odoo.fetch_records,
+            model=model,
+            fields=fields + ["write_date"],
+            use_cache=False,
+        ),
+        [],
+        "write_date",
+        after,
+        limit,
+    )
+
+    next_watermark = since
+    if position is not None:
+        next_watermark = encode_cursor({"sort": "write_date", **position})
+
+    return ChangeFeed(
+        records=[flatten(record) for record in records],
+        next_watermark=next_watermark,
+        has_more=has_more,
+    )
@@ -1,24 +1,47 @@
+from functools import partial
 from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from ....core.conditional import ConditionalRequest
 from ....core.constants import PARTNER_FIELDS
+from ....core.fieldsets import SparseFields
+from ....core.filters import RecordFilter
+from ....core.formats import FORMAT_RESPONSES, ResponseFormat
+from ....core.metrics import TimedRoute
+from ....core.pagination import CursorPage
+from ....core.responses import render
 from ....core.security import get_current_user
 from ....schemas.partner import Partner
-from ....services.odoo import odoo
+from ....services.replica import fetch_records
 
-router = APIRouter(dependencies=[Depends(get_current_user)])
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
 
 
-@router.get("", response_model=List[Partner])
-async def get_partners(limit: int = 10) -> List[Dict]:
+@router.get("", response_model=List[Partner], responses=FORMAT_RESPONSES)
+async def get_partners(
+    response: Response,
+    page: CursorPage = Depends(),
+    fieldset: SparseFields = Depends(),
+    query: RecordFilter = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    output: ResponseFormat = Depends(),
+) -> List[Dict]:
     """
     Get partners from Odoo.
 
-    Retrieves a list of company partners from Odoo.
+    Retrieves a page of company partners from Odoo, or from the local
+    replica when it is enabled and fresh. The cursor of the next page is
+    returned in the X-Next-Cursor header.
 
     Args:
-        limit: Maximum number of partners to return (default: 10)
+        page: Pagination parameters (limit, cursor, sort)
+        fieldset: Fields to return, all default fields when not given
+        query: Filter and order applied by Odoo; no cursor is returned when
+            a custom order is given
+        conditional: ETag and Last-Modified validators; a 304 is returned
+            when the client's copy is current
+        output: Response layout, a list of objects or columnar
 
     Returns:
         List[Partner]: List of partners
@@ -26,17 +49,37 @@ async def get_partners(limit: int = 10) -> List[Dict]:
     Raises:
         HTTPException: If there's an error fetching partners from Odoo
     """
-    partners = await odoo.fetch_records(
-        model="res.partner",
-        domain=[],
-        fields=PARTNER_FIELDS,
-        limit=limit,
+    page.use_order(query.order("res.partner"))
+    fields = await fieldset.resolve("res.partner", PARTNER_FIELDS)
+    domain = await query.domain("res.partner")
+    conditional.vary(output.layout)
+    current = await conditional.unchanged("res.partner", domain, page)
+    if current is not None:
+        not_modified = conditional.not_modified(current)
+        page.set_next_cursor(not_modified)
+        return not_modified
+
+    partners = await page.read(
+        partial(
+            fetch_records,
+            model="res.partner",
+            fields=conditional.fields(page.fields(fields)),
+            use_cache=not conditional.revalidating,
+        ),
+        domain,
     )
-    return partners
+    page.set_next_cursor(response)
+    conditional.set_validators(response, partners)
+    return output.render(partners, List[Partner], response, fields=fieldset.requested)
 
 
 @router.get("/{partner_id}", response_model=Partner)
-async def get_partner(partner_id: int) -> Dict:
+async def get_partner(
+    partner_id: int,
+    response: Response,
+    fieldset: SparseFields = Depends(),
+    conditional: ConditionalRequest = Depends(),
+) -> Dict:
     """
     Get a single partner from Odoo.
 
@@ -44,6 +87,9 @@ async def get_partner(partner_id: int) -> Dict:
 
     Args:
         partner_id: The unique identifier of the partner
+        fieldset: Fields to return, all default fields when not given
+        conditional: ETag and Last-Modified validators; a 304 is returned
+            when the client's copy is current
 
     Returns:
         Partner: The requested partner
@@ -51,11 +97,21 @@ async def get_partner(partner_id: int) -> Dict:
     Raises:
         HTTPException: If the partner is not found or there's an error fetching from Odoo
     """
-    partners = await odoo.fetch_records(
-        model="res.partner", domain=[["id", "=", partner_id]], fields=PARTNER_FIELDS
+    domain = [["id", "=", partner_id]]
+    current = await conditional.unchanged("res.partner", domain)
+    if current:
+        return conditional.not_modified(current)
+
+    fields = await fieldset.resolve("res.partner", PARTNER_FIELDS)
+    partners = await fetch_records(
+        model="res.partner",
+        domain=domain,
+        fields=conditional.fields(fields),
+        use_cache=not conditional.revalidating,
     )
 
     if not partners:
         raise HTTPException(status_code=404, detail="Partner not found")
 
-    return partners[0]
+    conditional.set_validators(response, partners)
+    return render(partners[0], Partner, response, fields=fieldset.requested)
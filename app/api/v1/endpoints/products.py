@@ -1,24 +1,48 @@
+from functools import partial
 from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from ....core.conditional import ConditionalRequest
 from ....core.constants import PRODUCT_FIELDS
+from ....core.fieldsets import SparseFields
+from ....core.filters import RecordFilter
+from ....core.formats import FORMAT_RESPONSES, ResponseFormat
+from ....core.metrics import TimedRoute
+from ....core.pagination import CursorPage
+from ....core.responses import render
 from ....core.security import get_current_user
 from ....schemas.product import Product
-from ....services.odoo import odoo
+from ....services.replica import fetch_records
 
-router = APIRouter(dependencies=[Depends(get_current_user)])  # Enforces authentication
+# Enforces authentication
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
 
 
-@router.get("", response_model=List[Product])
-async def get_products(limit: int = 10) -> List[Dict]:
+@router.get("", response_model=List[Product], responses=FORMAT_RESPONSES)
+async def get_products(
+    response: Response,
+    page: CursorPage = Depends(),
+    fieldset: SparseFields = Depends(),
+    query: RecordFilter = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    output: ResponseFormat = Depends(),
+) -> List[Dict]:
     """
     Get products from Odoo.
 
-    Retrieves a list of products from Odoo with optional limit.
+    Retrieves a page of products from Odoo, or from the local replica when
+    it is enabled and fresh. The cursor of the next page is returned in the
+    X-Next-Cursor header.
 
     Args:
-        limit: Maximum number of products to return (default: 10)
+        page: Pagination parameters (limit, cursor, sort)
+        fieldset: Fields to return, all default fields when not given
+        query: Filter and order applied by Odoo; no cursor is returned when
+            a custom order is given
+        conditional: ETag and Last-Modified validators; a 304 is returned
+            when the client's copy is current
+        output: Response layout, a list of objects or columnar
 
     Returns:
         List[Product]: List of products
@@ -26,14 +50,37 @@ async def get_products(limit: int = 10) -> List[Dict]:
     Raises:
         HTTPException: If there's an error fetching products from Odoo
     """
-    products = await odoo.fetch_records(
-        model="product.template", domain=[], fields=PRODUCT_FIELDS, limit=limit
+    page.use_order(query.order("product.template"))
+    fields = await fieldset.resolve("product.template", PRODUCT_FIELDS)
+    domain = await query.domain("product.template")
+    conditional.vary(output.layout)
+    current = await conditional.unchanged("product.template", domain, page)
+    if current is not None:
+        not_modified = conditional.not_modified(current)
+        page.set_next_cursor(not_modified)
+        return not_modified
+
+    products = await page.read(
+        partial(
+            fetch_records,
+            model="product.template",
+            fields=conditional.fields(page.fields(fields)),
+            use_cache=not conditional.revalidating,
+        ),
+        domain,
     )
-    return products
+    page.set_next_cursor(response)
+    conditional.set_validators(response, products)
+    return output.render(products, List[Product], response, fields=fieldset.requested)
 
 
 @router.get("/{product_id}", response_model=Product)
-async def get_product(product_id: int) -> Dict:
+async def get_product(
+    product_id: int,
+    response: Response,
+    fieldset: SparseFields = Depends(),
+    conditional: ConditionalRequest = Depends(),
+) -> Dict:
     """
     Get a single product from Odoo.
 
@@ -41,6 +88,9 @@ async def get_product(product_id: int) -> Dict:
 
     Args:
         product_id: The unique identifier of the product
+        fieldset: Fields to return, all default fields when not given
+        conditional: ETag and Last-Modified validators; a 304 is returned
+            when the client's copy is current
 
     Returns:
         Product: The requested product
@@ -48,13 +98,21 @@ async def get_product(product_id: int) -> Dict:
     Raises:
         HTTPException: If the product is not found or there's an error fetching from Odoo
     """
-    products = await odoo.fetch_records(
+    domain = [["id", "=", product_id]]
+    current = await conditional.unchanged("product.template", domain)
+    if current:
+        return conditional.not_modified(current)
+
+    fields = await fieldset.resolve("product.template", PRODUCT_FIELDS)
+    products = await fetch_records(
         model="product.template",
-        domain=[["id", "=", product_id]],
-        fields=PRODUCT_FIELDS,
+        domain=domain,
+        fields=conditional.fields(fields),
+        use_cache=not conditional.revalidating,
     )
 
     if not products:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    return products[0]
+    conditional.set_validators(response, products)
+    return render(products[0], Product, response, fields=fieldset.requested)
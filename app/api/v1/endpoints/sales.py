@@ -1,24 +1,215 @@
-from typing import List
+import asyncio
+from collections import defaultdict
+from functools import partial
+from typing import Any, Dict, List, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from ....core.constants import SALE_ORDER_FIELDS, SALE_ORDER_LINE_FIELDS
+from ....core.conditional import ConditionalRequest
+from ....core.constants import (
+    PARTNER_FIELDS,
+    PRODUCT_FIELDS,
+    SALE_ORDER_FIELDS,
+    SALE_ORDER_LINE_FIELDS,
+)
+from ....core.fieldsets import SparseFields
+from ....core.filters import RecordFilter
+from ....core.formats import FORMAT_RESPONSES, ResponseFormat
+from ....core.metrics import TimedRoute
+from ....core.pagination import CursorPage
+from ....core.responses import render
 from ....core.security import get_current_user
 from ....schemas.sale import SaleOrder
 from ....services.odoo import odoo
 
-router = APIRouter(dependencies=[Depends(get_current_user)])
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
 
+# Related records that can be embedded: name -> (model, fields)
+EXPANSIONS = {
+    "partner": ("res.partner", PARTNER_FIELDS),
+    "product": ("product.product", PRODUCT_FIELDS),
+}
 
-@router.get("", response_model=List[SaleOrder])
-async def get_sale_orders(limit: int = 10):
+
+def parse_expand(
+    expand: Optional[str] = Query(
+        None, description="Comma-separated related records to embed: partner,product"
+    ),
+) -> Set[str]:
+    """
+    Parse the ``expand`` query parameter.
+
+    Raises:
+        HTTPException: If an unknown expansion is requested
+    """
+    if not expand:
+        return set()
+    names = {name.strip() for name in expand.split(",") if name.strip()}
+    unknown = sorted(names - set(EXPANSIONS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown expansions: {', '.join(unknown)}",
+        )
+    return names
+
+
+def many2one_id(value: Any) -> Optional[int]:
+    """Return the id of an Odoo many2one value, None when it's empty."""
+    return value[0] if isinstance(value, list) and value else None
+
+
+async def attach_order_lines(orders: List[Dict]) -> List[Dict]:
+    """
+    Load the lines of all given orders with a single Odoo call.
+
+    Lines are fetched with an ``order_id in [...]`` domain and grouped in
+    memory, so the number of round-trips doesn't grow with the number of
+    orders.
+
+    Args:
+        orders: Sale order records, each with an ``id``
+
+    Returns:
+        List[Dict]: The same orders with ``order_lines`` filled in
+    """
+    lines_by_order = defaultdict(list)
+    if orders:
+        order_lines = await odoo.fetch_records(
+            model="sale.order.line",
+            domain=[("order_id", "in", [order["id"] for order in orders])],
+            fields=SALE_ORDER_LINE_FIELDS + ["order_id"],
+        )
+        for line in order_lines:
+            lines_by_order[line["order_id"][0]].append(line)
+
+    for order in orders:
+        order["order_lines"] = lines_by_order[order["id"]]
+    return orders
+
+
+async def read_by_id(model: str, fields: List[str], ids: Set[int]) -> Dict[int, Dict]:
+    """Read records with a single ``id in [...]`` call, keyed by id."""
+    if not ids:
+        return {}
+    records = await odoo.fetch_records(
+        model=model, domain=[("id", "in", sorted(ids))], fields=fields
+    )
+    return {record["id"]: record for record in records}
+
+
+async def expand_related(orders: List[Dict], expand: Set[str]) -> List[Dict]:
+    """
+    Embed the partners and products referenced by orders and their lines.
+
+    The referenced ids are collected across all orders and each model is
+    read once, concurrently, whatever the number of orders and lines.
+
+    Args:
+        orders: Sale order records, with ``order_lines`` attached when
+            products are expanded
+        expand: Expansions to apply, see ``EXPANSIONS``
+
+    Returns:
+        List[Dict]: The same orders with ``partner`` and line ``product``
+        filled in
+    """
+    lines = [line for order in orders for line in order.get("order_lines", [])]
+    referenced = {
+        "partner": {many2one_id(order.get("partner_id")) for order in orders},
+        "product": {many2one_id(line.get("product_id")) for line in lines},
+    }
+    names = sorted(expand)
+    related = dict(
+        zip(
+            names,
+            await asyncio.gather(
+                *(
+                    read_by_id(*EXPANSIONS[name], referenced[name] - {None})
+                    for name in names
+                )
+            ),
+        )
+    )
+
+    if "partner" in related:
+        for order in orders:
+            order["partner"] = related["partner"].get(
+                many2one_id(order.get("partner_id"))
+            )
+    if "product" in related:
+        for line in lines:
+            line["product"] = related["product"].get(
+                many2one_id(line.get("product_id"))
+            )
+    return orders
+
+
+def expansion_fields(
+    fieldset: SparseFields, fields: List[str], expand: Set[str]
+) -> List[str]:
+    """
+    Add the many2one fields expansions are joined on to a field list.
+
+    Raises:
+        HTTPException: If products are expanded without the order lines
+    """
+    if "product" in expand and not fieldset.includes("order_lines"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expanding product requires order_lines",
+        )
+    if "partner" in expand and "partner_id" not in fields:
+        return fields + ["partner_id"]
+    return fields
+
+
+def rendered_fields(fieldset: SparseFields, expand: Set[str]) -> Optional[List[str]]:
+    """
+    Return the fields to render, including an expanded ``partner``.
+
+    The partner comes with the ``partner_id`` it's joined on, which would
+    otherwise be rendered as Odoo's raw ``[id, name]`` pair.
+    """
+    if fieldset.requested is None or "partner" not in expand:
+        return fieldset.requested
+    return list(dict.fromkeys(fieldset.requested + ["partner_id", "partner"]))
+
+
+@router.get(
+    "",
+    response_model=List[SaleOrder],
+    responses=FORMAT_RESPONSES,
+    response_model_exclude_unset=True,
+)
+async def get_sale_orders(
+    response: Response,
+    page: CursorPage = Depends(),
+    fieldset: SparseFields = Depends(),
+    query: RecordFilter = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    expand: Set[str] = Depends(parse_expand),
+    output: ResponseFormat = Depends(),
+):
     """
     Get sale orders from Odoo.
 
-    Retrieves a list of sale orders with their lines from Odoo.
+    Retrieves a page of sale orders with their lines from Odoo. The cursor of
+    the next page is returned in the X-Next-Cursor header.
 
     Args:
-        limit: Maximum number of orders to return (default: 10)
+        page: Pagination parameters (limit, cursor, sort)
+        fieldset: Fields to return, all default fields when not given;
+            lines are only loaded when ``order_lines`` is selected
+        query: Filter and order applied by Odoo; no cursor is returned when
+            a custom order is given
+        conditional: ETag and Last-Modified validators, which also cover
+            the line ids; a 304 is returned when the client's copy is current.
+            Expanded responses carry no validators.
+        expand: Related records to embed, ``partner`` and ``product``; each
+            model is read once for the whole page
+        output: Response layout, a list of objects or columnar; embedded
+            lines and records stay objects within their cells
 
     Returns:
         List[SaleOrder]: List of sale orders with their lines
@@ -26,24 +217,48 @@ async def get_sale_orders(limit: int = 10):
     Raises:
         HTTPException: If there's an error fetching orders from Odoo
     """
-    orders = await odoo.fetch_records(
-        model="sale.order", domain=[], fields=SALE_ORDER_FIELDS, limit=limit
-    )
+    page.use_order(query.order("sale.order"))
+    fields = await fieldset.resolve("sale.order", SALE_ORDER_FIELDS, {"order_lines"})
+    fields = expansion_fields(fieldset, fields, expand)
+    if fieldset.includes("order_lines"):
+        conditional.track("order_line")
+    if expand:
+        conditional.ignore()
+    domain = await query.domain("sale.order")
+    conditional.vary(output.layout)
+    current = await conditional.unchanged("sale.order", domain, page)
+    if current is not None:
+        not_modified = conditional.not_modified(current)
+        page.set_next_cursor(not_modified)
+        return not_modified
 
-    # Fetch order lines for each order
-    for order in orders:
-        order_lines = await odoo.fetch_records(
-            model="sale.order.line",
-            domain=[("order_id", "=", order["id"])],
-            fields=SALE_ORDER_LINE_FIELDS,
-        )
-        order["order_lines"] = order_lines
-
-    return orders
+    orders = await page.read(
+        partial(
+            odoo.fetch_records,
+            model="sale.order",
+            fields=conditional.fields(page.fields(fields)),
+            use_cache=not conditional.revalidating,
+        ),
+        domain,
+    )
+    page.set_next_cursor(response)
+    conditional.set_validators(response, orders)
+    if fieldset.includes("order_lines"):
+        await attach_order_lines(orders)
+    await expand_related(orders, expand)
+    return output.render(
+        orders, List[SaleOrder], response, fields=rendered_fields(fieldset, expand)
+    )
 
 
-@router.get("/{order_id}", response_model=SaleOrder)
-async def get_sale_order(order_id: int):
+@router.get("/{order_id}", response_model=SaleOrder, response_model_exclude_unset=True)
+async def get_sale_order(
+    order_id: int,
+    response: Response,
+    fieldset: SparseFields = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    expand: Set[str] = Depends(parse_expand),
+):
     """
     Get a single sale order from Odoo.
 
@@ -51,6 +266,12 @@ async def get_sale_order(order_id: int):
 
     Args:
         order_id: The unique identifier of the sale order
+        fieldset: Fields to return, all default fields when not given;
+            lines are only loaded when ``order_lines`` is selected
+        conditional: ETag and Last-Modified validators, which also cover
+            the line ids; a 304 is returned when the client's copy is current.
+            Expanded responses carry no validators.
+        expand: Related records to embed, ``partner`` and ``product``
 
     Returns:
         SaleOrder: The requested sale order with its lines
@@ -58,24 +279,34 @@ async def get_sale_order(order_id: int):
     Raises:
         HTTPException: If the order is not found or there's an error fetching from Odoo
     """
+    fields = await fieldset.resolve("sale.order", SALE_ORDER_FIELDS, {"order_lines"})
+    fields = expansion_fields(fieldset, fields, expand)
+    if fieldset.includes("order_lines"):
+        conditional.track("order_line")
+    if expand:
+        conditional.ignore()
+    domain = [["id", "=", order_id]]
+    current = await conditional.unchanged("sale.order", domain)
+    if current:
+        return conditional.not_modified(current)
+
     orders = await odoo.fetch_records(
-        model="sale.order", domain=[["id", "=", order_id]], fields=SALE_ORDER_FIELDS
+        model="sale.order",
+        domain=domain,
+        fields=conditional.fields(fields),
+        use_cache=not conditional.revalidating,
     )
 
     if not orders:
         raise HTTPException(status_code=404, detail="Sale order not found")
 
-    order = orders[0]
-
-    # Fetch order lines
-    order_lines = await odoo.fetch_records(
-        model="sale.order.line",
-        domain=[("order_id", "=", order_id)],
-        fields=SALE_ORDER_LINE_FIELDS,
+    if fieldset.includes("order_lines"):
+        await attach_order_lines(orders)
+    await expand_related(orders, expand)
+    conditional.set_validators(response, orders)
+    return render(
+        orders[0], SaleOrder, response, fields=rendered_fields(fieldset, expand)
     )
-    order["order_lines"] = order_lines
-
-    return order
 
 
 @router.get("/{order_id}/lines", response_model=List[dict])
@@ -0,0 +1,75 @@
+"""Full-text search over products and partners."""
+
+from typing import Dict, List
+
+from fastapi import APIRouter, Depends, Query
+
+from ....core.config import settings
+from ....core.constants import PARTNER_FIELDS, PRODUCT_FIELDS, SEARCH_FIELDS
+from ....core.metrics import TimedRoute
+from ....core.security import get_current_user
+from ....schemas.partner import Partner
+from ....schemas.product import Product
+from ....services.odoo import odoo
+from ....services.replica import replica
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+
+async def search_records(
+    model: str, fields: List[str], text: str, limit: int
+) -> List[Dict]:
+    """
+    Search a model by name, from the replica index when possible.
+
+    The replica ranks prefix matches of every word; the live fallback asks
+    Odoo for records whose search fields contain the whole text.
+    """
+    if settings.replica_enabled:
+        records = await replica.search(model, text, limit)
+        if records is not None:
+            return records
+
+    search_fields = SEARCH_FIELDS[model]
+    domain = ["|"] * (len(search_fields) - 1) + [
+        (field, "ilike", text) for field in search_fields
+    ]
+    return await odoo.fetch_records(
+        model=model, domain=domain, fields=fields, limit=limit
+    )
+
+
+@router.get("/products", response_model=List[Product])
+async def search_products(
+    q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=100)
+) -> List[Dict]:
+    """
+    Search products by name or internal reference.
+
+    Args:
+        q: Text to search for
+        limit: Maximum number of results
+
+    Returns:
+        List[Product]: Matching products, best matches first when served
+            from the replica
+    """
+    return await search_records("product.template", PRODUCT_FIELDS, q, limit)
+
+
+@router.get("/partners", response_model=List[Partner])
+async def search_partners(
+    q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=100)
+) -> List[Dict]:
+    """
+    Search partners by name or email.
+
+    Args:
+        q: Text to search for
+        limit: Maximum number of results
+
+    Returns:
+        List[Partner]: Matching partners, best matches first when served
+            from the replica
+    """
+    return await search_records("res.partner", PARTNER_FIELDS, q, limit)
@@ -0,0 +1,64 @@
+"""Server-Sent Events push of Odoo record changes."""
+
+import asyncio
+import json
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from ....core.config import settings
+from ....core.constants import RESOURCES
+from ....core.metrics import TimedRoute
+from ....core.security import get_current_user
+from ....services.watcher import watcher
+
+router = APIRouter(route_class=TimedRoute, dependencies=[Depends(get_current_user)])
+
+
+@router.get("/{resource}")
+async def stream_changes(resource: str, request: Request) -> StreamingResponse:
+    """
+    Subscribe to changes of a resource as Server-Sent Events.
+
+    Every subscriber of a resource is fed by one shared poller, so any
+    number of connected clients cost a single query loop against Odoo.
+    Each ``changes`` event carries the records modified since the previous
+    event; its id is a watermark that can be passed to ``/changes`` as
+    ``since`` to catch up after a disconnect. Comments are sent as
+    keep-alives while nothing changes.
+
+    Args:
+        resource: One of ``partners``, ``products``, ``sales`` or ``sale-lines``
+
+    Returns:
+        StreamingResponse: An endless ``text/event-stream``
+
+    Raises:
+        HTTPException: If the resource is unknown
+    """
+    if resource not in RESOURCES:
+        raise HTTPException(status_code=404, detail="Unknown resource")
+    model_watcher = watcher.get(*RESOURCES[resource])
+
+    async def events() -> AsyncIterator[str]:
+        queue = model_watcher.subscribe()
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.stream_heartbeat
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(event["records"])
+                yield f"id: {event['id']}\nevent: changes\ndata: {data}\n\n"
+        finally:
+            model_watcher.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,19 @@
 from fastapi import APIRouter
 
-from .endpoints import authorization, partners, products, sales
+from .endpoints import (
+    admin,
+    aggregates,
+    authorization,
+    batch,
+    cache,
+    changes,
+    export,
+    partners,
+    products,
+    sales,
+    search,
+    stream,
+)
 
 api_router = APIRouter()
 
@@ -8,3 +21,11 @@ api_router.include_router(authorization.router, tags=["authentication"])
 api_router.include_router(partners.router, prefix="/partners", tags=["partners"])
 api_router.include_router(products.router, prefix="/products", tags=["products"])
 api_router.include_router(sales.router, prefix="/sales", tags=["sales"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(aggregates.router, prefix="/aggregates", tags=["aggregates"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
+api_router.include_router(stream.router, prefix="/stream", tags=["stream"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(cache.router, prefix="/cache", tags=["cache"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
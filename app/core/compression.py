@@ -0,0 +1,245 @@
+"""Response compression negotiated from the ``Accept-Encoding`` header."""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+from .metrics import timed
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Responses that never carry a body.
+BODYLESS_STATUSES = {204, 205, 304}
+
+
+class Encoder(ABC):
+    """Incremental compressor of one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Feed data to the compressor, returning whatever output is ready."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return everything compressed so far, so a streamed chunk can be sent."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return the rest of the compressed body, ending the stream."""
+
+
+class GzipEncoder(Encoder):
+    def __init__(self, level: int):
+        # wbits 16 + 15 selects the gzip container with the largest window
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(Encoder):
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(Encoder):
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+# Content codings available in this process; brotli and zstd need the
+# optional ``brotli`` and ``zstandard`` packages.
+ENCODERS: Dict[str, Callable[[], Encoder]] = {
+    "gzip": lambda: GzipEncoder(settings.compression_gzip_level)
+}
+if brotli is not None:
+    ENCODERS["br"] = lambda: BrotliEncoder(settings.compression_brotli_quality)
+if zstandard is not None:
+    ENCODERS["zstd"] = lambda: ZstdEncoder(settings.compression_zstd_level)
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def negotiate(accept_encoding: str, preferred: List[str]) -> Optional[str]:
+    """
+    Pick the content coding of a response.
+
+    Among the available codings the client accepts, the one with the highest
+    q-value wins; ties go to the one listed first in ``preferred``.
+
+    Args:
+        accept_encoding: Value of the request's ``Accept-Encoding`` header
+        preferred: Codings in the server's order of preference
+
+    Returns:
+        Optional[str]: The coding to use, or None to send the body as is
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding:
+            qualities[coding] = _quality(params)
+
+    best, best_quality = None, 0.0
+    for coding in preferred:
+        if coding not in ENCODERS:
+            continue
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compressible(headers: Headers) -> bool:
+    """
+    Tell whether a response is worth compressing.
+
+    Text, JSON and XML bodies are, unless already encoded or marked
+    ``no-transform``. Event streams aren't, so each event reaches the client
+    as soon as it's sent.
+    """
+    if "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", "").lower():
+        return False
+    media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith("text/") or media_type.endswith(("json", "xml"))
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with the best coding the client accepts.
+
+    Complete bodies smaller than ``compression_minimum_size`` bytes, or that
+    wouldn't shrink, are sent as is. Streamed bodies are compressed chunk by
+    chunk, each chunk flushed so clients can decode it on arrival. A strong
+    ``ETag`` is made weak on compressed responses, since the bytes sent
+    differ from the identity representation it was computed from.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""),
+            settings.compression_encodings,
+        )
+        start: Optional[Message] = None
+        encoder: Optional[Encoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if encoder is not None:
+                more_body = message.get("more_body", False)
+                with timed("compress"):
+                    body = encoder.compress(message.get("body", b""))
+                    body += encoder.flush() if more_body else encoder.finish()
+                message["body"] = body
+                await send(message)
+                return
+
+            # First message after the response start: decide how to send it.
+            passthrough = True
+            headers = MutableHeaders(scope=start)
+            if (
+                message["type"] != "http.response.body"
+                or start["status"] in BODYLESS_STATUSES
+                or not compressible(headers)
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if coding is None or (
+                not more_body and len(body) < settings.compression_minimum_size
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            with timed("compress"):
+                encoder = ENCODERS[coding]()
+                compressed = encoder.compress(body)
+                compressed += encoder.flush() if more_body else encoder.finish()
+            if not more_body and len(compressed) >= len(body):
+                await send(start)
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = coding
+            etag = headers.get("etag")
+            if etag is not None and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag
+            if more_body:
+                del headers["Content-Length"]
+                passthrough = False
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            message["body"] = compressed
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,158 @@
+"""Conditional GETs with validators derived from Odoo write dates."""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request, Response, status
+
+from ..services.odoo import odoo
+from .pagination import CursorPage
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _parse_write_date(value: str) -> datetime:
+    """Parse an Odoo datetime, which is always stored in UTC."""
+    return datetime.strptime(value, ODOO_DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class ConditionalRequest:
+    """
+    ETag and Last-Modified handling shared by the record endpoints.
+
+    Both validators are computed from the ids and ``write_date`` of the
+    records in the response, so they can be recomputed with a ``search_read``
+    of ``write_date`` alone. That probe only runs when the client sends
+    ``If-None-Match`` or ``If-Modified-Since``; if the client's copy is
+    current, the endpoint answers 304 without fetching the records.
+
+    The ETag also covers the query string, as different parameters give
+    different representations of the same records. Last-Modified is the
+    latest ``write_date`` of the records, which doesn't move when a record
+    leaves a list; clients should prefer the ETag.
+    """
+
+    def __init__(self, request: Request):
+        self.variant = str(request.query_params)
+        self.if_none_match = request.headers.get("if-none-match")
+        self.if_modified_since = request.headers.get("if-modified-since")
+        self.tracked = ["write_date"]
+        self.enabled = True
+
+    @property
+    def revalidating(self) -> bool:
+        """
+        Whether the client sent a validator.
+
+        The probe reads Odoo directly, so the full read following a failed
+        revalidation must skip the cache too, or it could return the very
+        copy the client already has.
+        """
+        return self.enabled and (
+            self.if_none_match is not None or self.if_modified_since is not None
+        )
+
+    def ignore(self):
+        """
+        Leave validators out of a response.
+
+        For responses embedding other records, whose changes the validators
+        wouldn't reflect.
+        """
+        self.enabled = False
+
+    def vary(self, representation: str):
+        """
+        Tell apart the validators of representations negotiated from
+        request headers rather than the query string, e.g. with ``Accept``.
+        """
+        self.variant += f"|{representation}"
+
+    def track(self, *fields: str):
+        """Also derive the validators from ``fields``, e.g. one2many ids."""
+        self.tracked += [field for field in fields if field not in self.tracked]
+
+    def fields(self, fields: List[str]) -> List[str]:
+        """Add the fields the validators are computed from to a field list."""
+        return fields + [field for field in self.tracked if field not in fields]
+
+    def etag(self, records: List[Dict[str, Any]]) -> str:
+        versions = [
+            [record["id"], *(record.get(field) for field in self.tracked)]
+            for record in records
+        ]
+        payload = json.dumps([self.variant, versions], default=str).encode()
+        return '"%s"' % hashlib.sha256(payload).hexdigest()[:32]
+
+    def last_modified(self, records: List[Dict[str, Any]]) -> Optional[datetime]:
+        write_dates = [
+            record["write_date"] for record in records if record.get("write_date")
+        ]
+        return _parse_write_date(max(write_dates)) if write_dates else None
+
+    def _is_current(self, records: List[Dict[str, Any]]) -> bool:
+        if self.if_none_match is not None:
+            etag = self.etag(records)
+            tags = [tag.strip() for tag in self.if_none_match.split(",")]
+            return "*" in tags or any(
+                tag[2:] == etag if tag.startswith("W/") else tag == etag for tag in tags
+            )
+        try:
+            since = parsedate_to_datetime(self.if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        last_modified = self.last_modified(records)
+        return (
+            last_modified is not None
+            and since.tzinfo is not None
+            and last_modified <= since
+        )
+
+    async def unchanged(
+        self, model: str, domain: List, page: Optional[CursorPage] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Check whether the client's copy of a read is still current.
+
+        Args:
+            model: Odoo model name
+            domain: Domain of the read
+            page: Page of a list read, which also gets the position of the
+                next page
+
+        Returns:
+            Optional[List[Dict]]: The probed records (ids and tracked fields)
+            when the client's copy is current, None when the full read is
+            needed
+        """
+        if not self.revalidating:
+            return None
+        probe = partial(
+            odoo.fetch_records, model=model, fields=self.tracked, use_cache=False
+        )
+        if page is not None:
+            records = await page.read(probe, domain)
+        else:
+            records = await probe(domain=domain)
+        return records if self._is_current(records) else None
+
+    def set_validators(self, response: Response, records: List[Dict[str, Any]]):
+        """Set the ETag and Last-Modified headers describing ``records``."""
+        if not self.enabled:
+            return
+        response.headers["ETag"] = self.etag(records)
+        last_modified = self.last_modified(records)
+        if last_modified is not None:
+            response.headers["Last-Modified"] = format_datetime(
+                last_modified, usegmt=True
+            )
+
+    def not_modified(self, records: List[Dict[str, Any]]) -> Response:
+        """Build the 304 response for records the client already has."""
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        self.set_validators(response, records)
+        return response
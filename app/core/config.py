@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Dict, List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -20,6 +21,72 @@ class Settings(BaseSettings):
     odoo_username: str
     odoo_password: str
     secret_key: str = Field(..., env="SECRET_KEY")
+    # Validate and encode responses with precompiled pydantic-core adapters
+    fast_serialization: bool = False
+    token_cache_size: int = 10000
+
+    # Login: successful authentications are cached for login_cache_ttl
+    # seconds; attempts reaching Odoo are limited per user and per client IP
+    # within login_window seconds
+    login_cache_ttl: float = 300.0
+    login_cache_size: int = 1000
+    login_user_limit: int = 10
+    login_ip_limit: int = 30
+    login_window: float = 60.0
+
+    # Odoo transport
+    odoo_timeout: float = 30.0
+    odoo_max_workers: int = 10
+    odoo_pool_size: int = 10
+    odoo_pool_idle_timeout: float = 60.0
+    # Reads above the threshold are split into parallel chunked reads
+    odoo_chunked_read_threshold: int = 500
+    odoo_read_chunk_size: int = 200
+    odoo_read_concurrency: int = 4
+
+    # Read cache, TTLs in seconds per Odoo model; unlisted models aren't cached
+    cache_enabled: bool = True
+    cache_max_bytes: int = 32 * 1024 * 1024
+    cache_ttls: Dict[str, float] = {"product.template": 300, "res.partner": 300}
+
+    # Change streaming: poll interval and keep-alive period in seconds, and
+    # events buffered per subscriber
+    stream_poll_interval: float = 5.0
+    stream_heartbeat: float = 15.0
+    stream_queue_size: int = 100
+
+    # Prometheus metrics on /metrics and Server-Timing response headers
+    metrics_enabled: bool = True
+    # Requests taking longer than this many seconds are logged with their
+    # timing breakdown and Odoo calls; unset to disable
+    slow_request_threshold: Optional[float] = None
+
+    # Odoo logins allowed to use the /admin endpoints, e.g. the profiler
+    admin_users: List[str] = []
+    profile_max_seconds: float = 60.0
+
+    # Response compression, negotiated from Accept-Encoding in this order of
+    # preference; br and zstd need the optional brotli and zstandard packages.
+    # Bodies under compression_minimum_size bytes are sent uncompressed
+    compression_enabled: bool = True
+    compression_encodings: List[str] = ["zstd", "br", "gzip"]
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    compression_zstd_level: int = 3
+
+    # Maximum number of sub-requests in a POST /batch call
+    batch_max_requests: int = 50
+
+    # Local read replica of products and partners: synced every
+    # replica_sync_interval seconds and only read from while the last sync
+    # is at most replica_max_staleness seconds old
+    replica_enabled: bool = False
+    replica_path: str = ":memory:"
+    replica_sync_interval: float = 10.0
+    replica_max_staleness: float = 60.0
+    # Sync rounds between scans for deleted or archived records
+    replica_reconcile_every: int = 30
 
     class Config:
         """
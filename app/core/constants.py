@@ -11,6 +11,7 @@ SALE_ORDER_FIELDS = [
     "partner_id",
     "amount_total",
     "state",
+    "invoice_status",
 ]
 
 SALE_ORDER_LINE_FIELDS = [
@@ -19,3 +20,90 @@ SALE_ORDER_LINE_FIELDS = [
     "price_unit",
     "price_subtotal",
 ]
+
+# REST resources exposing Odoo models: resource name -> (model, fields)
+RESOURCES = {
+    "partners": ("res.partner", PARTNER_FIELDS),
+    "products": ("product.template", PRODUCT_FIELDS),
+    "sales": ("sale.order", SALE_ORDER_FIELDS),
+    "sale-lines": ("sale.order.line", SALE_ORDER_LINE_FIELDS + ["order_id"]),
+}
+
+# Text fields matched by /search, per model
+SEARCH_FIELDS = {
+    "product.template": ["name", "default_code"],
+    "res.partner": ["name", "email"],
+}
+
+# Fields clients may filter and order by, kept to indexed columns (plus the
+# few the clients need) so filters run as index scans in Odoo's database
+FILTERABLE_FIELDS = {
+    "res.partner": [
+        "id",
+        "name",
+        "email",
+        "ref",
+        "is_company",
+        "parent_id",
+        "create_date",
+        "write_date",
+    ],
+    "product.template": [
+        "id",
+        "name",
+        "default_code",
+        "list_price",
+        "categ_id",
+        "active",
+        "create_date",
+        "write_date",
+    ],
+    "sale.order": [
+        "id",
+        "name",
+        "partner_id",
+        "state",
+        "invoice_status",
+        "date_order",
+        "amount_total",
+        "create_date",
+        "write_date",
+    ],
+    "sale.order.line": [
+        "id",
+        "order_id",
+        "product_id",
+        "order_partner_id",
+        "state",
+        "create_date",
+        "write_date",
+    ],
+}
+
+# Aggregation endpoints: resource -> (model, group-by fields, measure fields)
+AGGREGATES = {
+    "sales": (
+        "sale.order",
+        [
+            "state",
+            "invoice_status",
+            "partner_id",
+            "user_id",
+            "team_id",
+            "company_id",
+            "date_order",
+        ],
+        ["amount_total", "amount_untaxed", "amount_tax"],
+    ),
+    "sale-lines": (
+        "sale.order.line",
+        ["product_id", "order_id", "order_partner_id", "state", "create_date"],
+        [
+            "product_uom_qty",
+            "qty_delivered",
+            "qty_invoiced",
+            "price_subtotal",
+            "price_total",
+        ],
+    ),
+}
@@ -0,0 +1,73 @@
+"""Client-selected sparse fieldsets."""
+
+from typing import List, Optional, Set
+
+from fastapi import HTTPException, Query, status
+
+from ..services.odoo import odoo
+
+# Field types that can't be selected: binary fields carry whole attachments.
+UNSELECTABLE_FIELD_TYPES = {"binary"}
+
+
+async def selectable_fields(model: str) -> Set[str]:
+    """Build the allowlist of selectable fields from cached fields_get metadata."""
+    meta = await odoo.fields_get(model)
+    return {
+        name
+        for name, attributes in meta.items()
+        if attributes.get("type") not in UNSELECTABLE_FIELD_TYPES
+    }
+
+
+class SparseFields:
+    """
+    The ``fields`` query parameter of the resource endpoints.
+
+    Selected fields are validated against the model's allowlist and sent to
+    Odoo as the ``fields`` of the read, so only those columns are fetched,
+    transferred and serialized. The record ``id`` is always included.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return, e.g. name,email"
+        ),
+    ):
+        self.requested: Optional[List[str]] = None
+        if fields is not None:
+            names = [name.strip() for name in fields.split(",") if name.strip()]
+            self.requested = list(dict.fromkeys(name for name in names if name != "id"))
+
+    def includes(self, field: str) -> bool:
+        """Tell whether a field is part of the response."""
+        return self.requested is None or field in self.requested
+
+    async def resolve(
+        self, model: str, default: List[str], virtual: Optional[Set[str]] = None
+    ) -> List[str]:
+        """
+        Return the Odoo fields to read.
+
+        Args:
+            model: Odoo model being read
+            default: Fields read when the client doesn't select any
+            virtual: Selectable names filled in by the API rather than read
+                from Odoo, e.g. ``order_lines``
+
+        Raises:
+            HTTPException: If a selected field isn't allowed
+        """
+        if self.requested is None:
+            return default
+        virtual = virtual or set()
+        allowed = await selectable_fields(model)
+        unknown = [f for f in self.requested if f not in allowed and f not in virtual]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown or unselectable fields: {', '.join(unknown)}",
+            )
+        # An empty field list would make Odoo return every field.
+        return [f for f in self.requested if f not in virtual] or ["id"]
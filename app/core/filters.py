@@ -0,0 +1,143 @@
+"""Filtering and ordering query language for the list endpoints."""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, Query, status
+
+from ..services.odoo import odoo
+from .constants import FILTERABLE_FIELDS
+
+# Filter operators and the Odoo domain operators they map to.
+OPERATORS = {
+    "=": "=",
+    "!=": "!=",
+    ">": ">",
+    ">=": ">=",
+    "<": "<",
+    "<=": "<=",
+    "~": "ilike",
+    "!~": "not ilike",
+    "@": "in",
+}
+
+TERM = re.compile(r"^([a-z_][a-z0-9_]*)(>=|<=|!=|!~|=|>|<|~|@)(.*)$")
+ORDER_TERM = re.compile(r"^([a-z_][a-z0-9_]*)(?:\s+(asc|desc))?$", re.IGNORECASE)
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def escape_like(value: str) -> str:
+    """Escape the LIKE wildcards in a value, so ``ilike`` matches it literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def coerce(value: str, field: str, field_type: Optional[str]) -> Any:
+    """Convert a filter value to the Python type Odoo expects for a field."""
+    if value == "null":
+        return False
+    try:
+        if field_type in ("integer", "many2one"):
+            return int(value)
+        if field_type in ("float", "monetary"):
+            return float(value)
+    except ValueError:
+        raise _bad_request(f"Invalid value for {field}: {value}")
+    if field_type == "boolean":
+        if value not in ("true", "false"):
+            raise _bad_request(f"Invalid value for {field}: {value}")
+        return value == "true"
+    return value
+
+
+def parse_filter(
+    expression: str, allowed: List[str], meta: Dict[str, Dict[str, Any]]
+) -> List:
+    """
+    Translate a filter expression into an Odoo domain.
+
+    The expression is a comma-separated list of ``<field><op><value>`` terms,
+    all of which must match. Operators are ``=``, ``!=``, ``>``, ``>=``,
+    ``<``, ``<=``, ``~`` (contains, case-insensitive), ``!~`` (doesn't
+    contain) and ``@`` (one of ``|``-separated values). ``null`` stands for
+    an empty value.
+
+    Example:
+        ``list_price>10,default_code~ABC,state@sale|done``
+
+    Raises:
+        HTTPException: If a term is malformed or uses a field not allowed
+    """
+    domain = []
+    for term in filter(None, (t.strip() for t in expression.split(","))):
+        match = TERM.match(term)
+        if not match:
+            raise _bad_request(f"Invalid filter term: {term}")
+        field, operator, value = match.groups()
+        if field not in allowed:
+            raise _bad_request(f"Filtering on {field} is not allowed")
+        field_type = meta.get(field, {}).get("type")
+        if operator in ("~", "!~"):
+            operand = escape_like(value)
+        elif operator == "@":
+            operand = [coerce(v, field, field_type) for v in value.split("|")]
+        else:
+            operand = coerce(value, field, field_type)
+        domain.append((field, OPERATORS[operator], operand))
+    return domain
+
+
+def parse_order(expression: str, allowed: List[str]) -> str:
+    """
+    Validate an ordering expression such as ``write_date desc,id``.
+
+    Raises:
+        HTTPException: If a term is malformed or uses a field not allowed
+    """
+    terms = []
+    for term in filter(None, (t.strip() for t in expression.split(","))):
+        match = ORDER_TERM.match(term)
+        if not match:
+            raise _bad_request(f"Invalid order term: {term}")
+        field, direction = match.groups()
+        if field not in allowed:
+            raise _bad_request(f"Ordering by {field} is not allowed")
+        terms.append(f"{field} {(direction or 'asc').lower()}")
+    return ", ".join(terms)
+
+
+class RecordFilter:
+    """
+    The ``filter`` and ``order`` query parameters of the list endpoints.
+
+    Filters are translated into an Odoo domain and the order into the
+    ``order`` of the read, so both are applied by Odoo's database. Only
+    fields listed in FILTERABLE_FIELDS for the model can be used.
+    """
+
+    def __init__(
+        self,
+        filter: Optional[str] = Query(
+            None, description="Comma-separated terms, e.g. list_price>10,name~desk"
+        ),
+        order: Optional[str] = Query(
+            None, description="Comma-separated fields, e.g. write_date desc,id"
+        ),
+    ):
+        self.filter = filter
+        self.order_by = order
+
+    async def domain(self, model: str) -> List:
+        """Return the Odoo domain of the filter."""
+        if not self.filter:
+            return []
+        meta = await odoo.fields_get(model)
+        return parse_filter(self.filter, FILTERABLE_FIELDS[model], meta)
+
+    def order(self, model: str) -> Optional[str]:
+        """Return the Odoo order clause, or None if no order was requested."""
+        if not self.order_by:
+            return None
+        return parse_order(self.order_by, FILTERABLE_FIELDS[model]) or None
@@ -0,0 +1,143 @@
+"""Columnar representations of list responses."""
+
+from typing import Any, Dict, List, Literal, Optional, Sequence
+
+from fastapi import Query, Request, Response
+from pydantic_core import to_json
+
+from .metrics import timed
+from .responses import RawJSONResponse, render, response_adapter
+
+ResponseLayout = Literal["json", "columnar", "columns"]
+
+# Media types selecting a columnar layout through the Accept header.
+MEDIA_TYPES: Dict[str, str] = {
+    "columnar": "application/vnd.odoo-fastapi.columnar+json",
+    "columns": "application/vnd.odoo-fastapi.columns+json",
+}
+
+# OpenAPI description of the alternative representations, for the
+# ``responses`` of list routes.
+FORMAT_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}}
+}
+
+
+def _quality(params: List[str]) -> float:
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def _accepted_layout(accept: str) -> Optional[str]:
+    """
+    Return the columnar layout the client prefers to JSON, if any.
+
+    A columnar media type is only picked when its q-value beats the one
+    JSON gets from ``application/json``, or failing that from
+    ``application/*`` or ``*/*``; ties go to JSON.
+    """
+    qualities: Dict[str, float] = {}
+    for item in accept.split(","):
+        media_type, *params = item.split(";")
+        media_type = media_type.strip().lower()
+        if media_type:
+            qualities[media_type] = _quality(params)
+
+    json_quality = 0.0
+    for media_type in ("application/json", "application/*", "*/*"):
+        if media_type in qualities:
+            json_quality = qualities[media_type]
+            break
+
+    best, best_quality = None, json_quality
+    for layout, media_type in MEDIA_TYPES.items():
+        quality = qualities.get(media_type, 0.0)
+        if quality > best_quality:
+            best, best_quality = layout, quality
+    return best
+
+
+def to_columnar(rows: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Turn records into their column names and one array of values per record."""
+    columns = list(dict.fromkeys(name for row in rows for name in row))
+    return {
+        "columns": columns,
+        "rows": [[row.get(name) for name in columns] for row in rows],
+    }
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, list]:
+    """Turn records into one array of values per column."""
+    columns = list(dict.fromkeys(name for row in rows for name in row))
+    return {name: [row.get(name) for row in rows] for name in columns}
+
+
+class ResponseFormat:
+    """
+    The ``format`` query parameter of the list endpoints.
+
+    ``json``, the default, is a list of objects. ``columnar`` gives the
+    column names once and each record as an array of values,
+    ``{"columns": [...], "rows": [[...], ...]}``, and ``columns`` one array
+    per column, ``{"name": [...], ...}``; both load straight into a
+    dataframe and drop the keys repeated in every record. The columnar
+    layouts can also be selected with their media type in ``Accept``; the
+    parameter takes precedence.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        format: Optional[ResponseLayout] = Query(
+            None, description="Response layout: json, columnar or columns"
+        ),
+    ):
+        self.layout: str = (
+            format or _accepted_layout(request.headers.get("accept", "")) or "json"
+        )
+
+    def render(
+        self,
+        content: List[Dict[str, Any]],
+        annotation: Any,
+        response: Response,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """
+        Render a list of records in the selected layout.
+
+        Records are validated and serialized as in the default layout, so
+        values are formatted the same, then reshaped and encoded by
+        pydantic-core.
+
+        Args:
+            content: Records as returned by Odoo
+            annotation: The route's response type, e.g. ``List[Product]``
+            response: The endpoint's response parameter, whose headers are kept
+            fields: Fields selected by the client, if any
+
+        Returns:
+            The content as rendered by ``render``, or a RawJSONResponse in a
+            columnar layout
+        """
+        response.headers.add_vary_header("Accept")
+        if self.layout == "json":
+            return render(content, annotation, response, fields=fields)
+
+        adapter = response_adapter(annotation, fields)
+        with timed("validate"):
+            rows = adapter.dump_python(
+                adapter.validate_python(content), mode="json", exclude_unset=True
+            )
+        with timed("encode"):
+            reshape = to_columnar if self.layout == "columnar" else to_columns
+            body = to_json(reshape(rows))
+        columnar_response = RawJSONResponse(body, media_type=MEDIA_TYPES[self.layout])
+        columnar_response.headers.raw.extend(response.headers.raw)
+        return columnar_response
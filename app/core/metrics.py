@@ -0,0 +1,443 @@
+"""Request instrumentation: Prometheus metrics and Server-Timing headers."""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from xmlrpc.client import Fault
+
+from fastapi import HTTPException
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Prometheus' default buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0)
+
+# Label of requests that didn't match a route, keeping 404s from random
+# paths out of the series.
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric(ABC):
+    """A metric family with a fixed set of label names."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _new_child(self):
+        """Return a new series, holding the values of one label combination."""
+
+    def labels(self, *values: str):
+        """Return the series of one combination of label values."""
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Yield the exposition lines of every series."""
+
+    def expose(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _Value:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in sorted(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_total{labels} {_format_value(child.value)}"
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in sorted(self._children.items()):
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}{labels} {_format_value(child.value)}"
+
+
+class _HistogramValue:
+    def __init__(self, buckets: Sequence[float]):
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.sum += value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in sorted(self._children.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames, values, f'le="{_format_value(bound)}"'
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class Registry:
+    """The metrics exposed on ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def expose(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        return "\n".join(metric.expose() for metric in self._metrics) + "\n"
+
+
+registry = Registry()
+
+HTTP_REQUESTS = registry.register(
+    Counter("http_requests", "HTTP requests handled", ("method", "route", "status"))
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time to handle HTTP requests, up to the response start",
+        ("method", "route"),
+    )
+)
+HTTP_REQUEST_PHASE_DURATION = registry.register(
+    Histogram(
+        "http_request_phase_duration_seconds",
+        "Time spent per phase of HTTP requests (auth, odoo, validate, encode, compress)",
+        ("route", "phase"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests being handled")
+)
+ODOO_REQUESTS = registry.register(
+    Counter("odoo_requests", "Calls made to Odoo", ("model", "method", "outcome"))
+)
+ODOO_REQUEST_DURATION = registry.register(
+    Histogram(
+        "odoo_request_duration_seconds",
+        "Duration of calls made to Odoo",
+        ("model", "method"),
+    )
+)
+ODOO_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("odoo_requests_in_flight", "Calls to Odoo awaiting a response")
+)
+ODOO_CACHE_REQUESTS = registry.register(
+    Counter("odoo_cache_requests", "Read cache lookups", ("model", "result"))
+)
+
+for _gauge in (HTTP_REQUESTS_IN_FLIGHT, ODOO_REQUESTS_IN_FLIGHT):
+    _gauge.labels()
+
+
+class Timings:
+    """
+    Time spent per phase while handling one request.
+
+    Attributes:
+        phases: Phase name -> [total seconds, number of measurements]
+        odoo_calls: ``(model, method, seconds)`` of each Odoo call
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, List[float]] = {}
+        self.odoo_calls: List[Tuple[str, str, float]] = []
+
+    def add(self, phase: str, seconds: float):
+        totals = self.phases.setdefault(phase, [0.0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+
+    def server_timing(self, total: float) -> str:
+        """Format the phases as a Server-Timing header value, in milliseconds."""
+        entries = []
+        for phase, (seconds, count) in self.phases.items():
+            entry = f"{phase};dur={seconds * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count} calls"'
+            entries.append(entry)
+        entries.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(entries)
+
+    def describe(self) -> str:
+        """Describe the phases and every Odoo call, for logs."""
+        phases = ", ".join(
+            f"{phase} {seconds * 1000:.1f} ms"
+            for phase, (seconds, _) in self.phases.items()
+        )
+        calls = "; ".join(
+            f"{model}.{method} {seconds * 1000:.1f} ms"
+            for model, method, seconds in self.odoo_calls
+        )
+        return f"phases: {phases or 'none'}; odoo calls: {calls or 'none'}"
+
+
+_timings: ContextVar[Optional[Timings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[Timings]:
+    """Return the timings of the request being handled, if any."""
+    return _timings.get()
+
+
+@contextmanager
+def timed(phase: str):
+    """Add the time spent in the block to a phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _timings.get()
+        if timings is not None:
+            timings.add(phase, time.perf_counter() - start)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON response adding its encoding time to the ``encode`` phase."""
+
+    def render(self, content: Any) -> bytes:
+        with timed("encode"):
+            return super().render(content)
+
+
+class _TimedResponseField:
+    """Response field adding FastAPI's validation and serialization to the phases."""
+
+    def __init__(self, field):
+        self._field = field
+
+    def __getattr__(self, name: str):
+        return getattr(self._field, name)
+
+    def validate(self, *args, **kwargs):
+        with timed("validate"):
+            return self._field.validate(*args, **kwargs)
+
+    def serialize(self, *args, **kwargs):
+        with timed("encode"):
+            return self._field.serialize(*args, **kwargs)
+
+
+class TimedRoute(APIRoute):
+    """
+    Route measuring the default serialization path.
+
+    Content returned as is by ``render`` is validated against the
+    ``response_model`` and encoded by FastAPI after the endpoint returns;
+    this route class times those steps as the ``validate`` and ``encode``
+    phases, like the fast path does.
+    """
+
+    def get_route_handler(self) -> Callable:
+        if self.secure_cloned_response_field is not None:
+            self.secure_cloned_response_field = _TimedResponseField(
+                self.secure_cloned_response_field
+            )
+        if (
+            isinstance(self.response_class, DefaultPlaceholder)
+            and self.response_class.value is JSONResponse
+        ):
+            self.response_class = DefaultPlaceholder(TimedJSONResponse)
+        return super().get_route_handler()
+
+
+@contextmanager
+def odoo_call(model: str, method: str):
+    """Measure one call to Odoo, for the metrics and the current request."""
+    in_flight = ODOO_REQUESTS_IN_FLIGHT.labels()
+    in_flight.inc()
+    outcome = "error"
+    start = time.perf_counter()
+    try:
+        yield
+        outcome = "ok"
+    except Fault:
+        outcome = "fault"
+        raise
+    except HTTPException as exc:
+        outcome = "timeout" if exc.status_code == 504 else "error"
+        raise
+    finally:
+        seconds = time.perf_counter() - start
+        in_flight.dec()
+        ODOO_REQUESTS.labels(model, method, outcome).inc()
+        ODOO_REQUEST_DURATION.labels(model, method).observe(seconds)
+        timings = _timings.get()
+        if timings is not None:
+            timings.add("odoo", seconds)
+            timings.odoo_calls.append((model, method, seconds))
+
+
+def record_cache_lookup(model: str, hit: bool):
+    ODOO_CACHE_REQUESTS.labels(model, "hit" if hit else "miss").inc()
+
+
+def route_label(scope: Scope) -> str:
+    """Label a request with the path template of its route, e.g. /products/{product_id}."""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return scope.get("root_path", "") + path
+
+
+def log_if_slow(
+    scope: Scope, route: str, status_code: int, seconds: float, timings: Timings
+):
+    """Log the timing breakdown of a request slower than the threshold."""
+    threshold = settings.slow_request_threshold
+    if threshold is None or seconds < threshold:
+        return
+    logger.warning(
+        "Slow request %s %s (route %s, status %s) took %.1f ms; %s",
+        scope["method"],
+        scope["path"],
+        route,
+        status_code,
+        seconds * 1000,
+        timings.describe(),
+    )
+
+
+class MetricsMiddleware:
+    """
+    Measure every HTTP request and add a ``Server-Timing`` header.
+
+    Requests slower than ``slow_request_threshold``, including the time to
+    send the body, are logged with their timing breakdown.
+
+    The header lists the time spent in each phase recorded during the
+    request, e.g. ``auth;dur=0.1, odoo;dur=42.0;desc="2 calls",
+    total;dur=45.3``, measured up to the start of the response. Durations
+    of concurrent Odoo calls add up, so ``odoo`` may exceed ``total``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = _timings.set(timings)
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels()
+        in_flight.inc()
+        start = time.perf_counter()
+        status_code = 500
+        elapsed = None
+
+        async def send_with_timing(message: Message):
+            nonlocal status_code, elapsed
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - start
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timings.server_timing(elapsed))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            in_flight.dec()
+            if elapsed is None:
+                elapsed = time.perf_counter() - start
+            route = route_label(scope)
+            HTTP_REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(elapsed)
+            for phase, (seconds, _) in timings.phases.items():
+                HTTP_REQUEST_PHASE_DURATION.labels(route, phase).observe(seconds)
+            _timings.reset(token)
+            log_if_slow(scope, route, status_code, time.perf_counter() - start, timings)
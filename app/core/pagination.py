@@ -0,0 +1,265 @@
+"""Keyset (cursor) pagination for list endpoints."""
+
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+SortKey = Literal["id", "write_date"]
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Reads records, called as ``fetch(domain=..., limit=..., order=...)``.
+Fetch = Callable[..., Awaitable[List[Dict[str, Any]]]]
+
+
+def _invalid_cursor(detail: str = "Invalid cursor") -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """Encode cursor data as an opaque URL-safe token."""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a token produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+    if not isinstance(data, dict):
+        raise _invalid_cursor()
+    return data
+
+
+def keyset_domain(after: Dict[str, Any]) -> List:
+    """
+    Build the Odoo domain selecting records after an ``id`` keyset position.
+
+    Positions of the ``write_date`` keyset can't be expressed as a single
+    domain; those pages are read with fetch_after.
+    """
+    return [("id", ">", after["id"])]
+
+
+def next_second(write_date: str) -> str:
+    """Return the Odoo datetime one second after ``write_date``."""
+    moment = datetime.strptime(write_date, ODOO_DATETIME_FORMAT)
+    return (moment + timedelta(seconds=1)).strftime(ODOO_DATETIME_FORMAT)
+
+
+def _within_second(write_date: str) -> List:
+    return [
+        ("write_date", ">=", write_date),
+        ("write_date", "<", next_second(write_date)),
+    ]
+
+
+async def fetch_after(
+    fetch: Fetch,
+    domain: List,
+    sort: SortKey,
+    after: Optional[Dict[str, Any]],
+    limit: Optional[int],
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], bool]:
+    """
+    Read the records following a keyset position.
+
+    Args:
+        fetch: Reads the records, e.g. a partial of ``odoo.fetch_records``
+        domain: The endpoint's own domain
+        sort: The keyset to follow
+        after: Position of the last record already read, None to start over
+        limit: Maximum number of records to read, None or 0 for all
+
+    Returns:
+        Tuple: The records, the position to continue from, and whether more
+        records may follow
+    """
+    if sort == "write_date":
+        return await _fetch_after_write_date(fetch, domain, after, limit)
+    records = await fetch(
+        domain=domain + (keyset_domain(after) if after else []),
+        limit=limit,
+        order=keyset_order("id"),
+    )
+    position = keyset_position("id", records[-1]) if records else after
+    return records, position, bool(limit) and len(records) == limit
+
+
+async def _fetch_after_write_date(
+    fetch: Fetch,
+    domain: List,
+    after: Optional[Dict[str, Any]],
+    limit: Optional[int],
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], bool]:
+    """
+    Read the records following a ``(write_date, id)`` position.
+
+    Odoo stores ``write_date`` with microseconds but returns it truncated to
+    the second, so a position can't name the exact timestamp of its record,
+    and records written within one second are ordered by their hidden
+    microseconds. The keyset is therefore the second and the id: records of
+    the position's second are read in id order, then the following seconds
+    in write order. Only the last second of a full page may have been cut
+    in write order; it's left for the next page, which reads it by id,
+    unless the page holds nothing else. Pages may thus hold fewer than
+    ``limit`` records before the end.
+    """
+    records: List[Dict[str, Any]] = []
+    later_domain = domain
+    if after is not None:
+        second = after["write_date"]
+        records = await fetch(
+            domain=domain + _within_second(second) + [("id", ">", after["id"])],
+            limit=limit,
+            order="id asc",
+        )
+        if limit and len(records) == limit:
+            return records, {"write_date": second, "id": records[-1]["id"]}, True
+        later_domain = domain + [("write_date", ">=", next_second(second))]
+
+    remaining = limit - len(records) if limit else None
+    later = await fetch(
+        domain=later_domain, limit=remaining, order=keyset_order("write_date")
+    )
+    if not remaining or len(later) < remaining:
+        records += later
+        if later:
+            second = later[-1]["write_date"]
+            last_id = max(r["id"] for r in later if r["write_date"] == second)
+            return records, {"write_date": second, "id": last_id}, False
+        if records:
+            return (
+                records,
+                {"write_date": after["write_date"], "id": records[-1]["id"]},
+                False,
+            )
+        return records, after, False
+
+    second = later[-1]["write_date"]
+    complete = [record for record in later if record["write_date"] != second]
+    if complete:
+        return records + complete, {"write_date": second, "id": 0}, True
+    tail = await fetch(
+        domain=domain + _within_second(second), limit=remaining, order="id asc"
+    )
+    last_id = tail[-1]["id"] if tail else 0
+    return records + tail, {"write_date": second, "id": last_id}, True
+
+
+def keyset_order(sort: SortKey) -> str:
+    """Return the Odoo ``order`` clause matching a keyset sort key."""
+    return "id asc" if sort == "id" else "write_date asc, id asc"
+
+
+def keyset_position(sort: SortKey, record: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the keyset position of a record."""
+    position = {"id": record["id"]}
+    if sort == "write_date":
+        position["write_date"] = record["write_date"]
+    return position
+
+
+def parse_position(sort: SortKey, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a decoded keyset position.
+
+    Raises:
+        HTTPException: If the position doesn't match the sort key
+    """
+    try:
+        position = {"id": int(data["id"])}
+        if sort == "write_date":
+            position["write_date"] = str(data["write_date"])
+            datetime.strptime(position["write_date"], ODOO_DATETIME_FORMAT)
+    except (KeyError, TypeError, ValueError):
+        raise _invalid_cursor()
+    return position
+
+
+class CursorPage:
+    """
+    Cursor pagination parameters shared by the list endpoints.
+
+    Pages are selected with a keyset domain rather than an offset, so every
+    page costs the same however deep the client goes. The cursor for the next
+    page is returned in the ``X-Next-Cursor`` response header and is absent on
+    the last page; with ``sort=write_date`` a page may hold fewer than
+    ``limit`` records before the last one (see fetch_after).
+    """
+
+    def __init__(
+        self,
+        limit: int = 10,
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor returned in X-Next-Cursor"
+        ),
+        sort: SortKey = Query("id", description="Keyset to page through"),
+    ):
+        self.limit = limit
+        self.sort = sort
+        self.after = None
+        self.custom_order = None
+        self.next_position: Optional[Dict[str, Any]] = None
+        if cursor:
+            data = decode_cursor(cursor)
+            if data.get("sort") != sort:
+                raise _invalid_cursor("Cursor does not match the requested sort")
+            self.after = parse_position(sort, data)
+
+    def use_order(self, order: Optional[str]):
+        """
+        Order the page by a client-selected order instead of the keyset.
+
+        Cursors can't express an arbitrary order, so none is returned for
+        such pages and passing one is rejected.
+        """
+        if order is None:
+            return
+        if self.after:
+            raise _invalid_cursor("Cursors can't be combined with a custom order")
+        self.custom_order = order
+
+    async def read(self, fetch: Fetch, domain: Optional[List] = None) -> List[Dict]:
+        """
+        Read the page and remember where the next one starts.
+
+        Args:
+            fetch: Reads the records, called as
+                ``fetch(domain=..., limit=..., order=...)``
+            domain: The endpoint's own domain
+        """
+        domain = list(domain or [])
+        if self.custom_order:
+            self.next_position = None
+            return await fetch(domain=domain, limit=self.limit, order=self.custom_order)
+        records, position, has_more = await fetch_after(
+            fetch, domain, self.sort, self.after, self.limit
+        )
+        self.next_position = position if has_more else None
+        return records
+
+    def fields(self, fields: List[str]) -> List[str]:
+        """Add the fields the keyset needs to a field list."""
+        if self.sort == "write_date" and "write_date" not in fields:
+            return fields + ["write_date"]
+        return fields
+
+    def next_cursor(self) -> Optional[str]:
+        """Return the cursor of the page after the one read, if there may be one."""
+        if self.next_position is None:
+            return None
+        return encode_cursor({"sort": self.sort, **self.next_position})
+
+    def set_next_cursor(self, response: Response):
+        cursor = self.next_cursor()
+        if cursor:
+            response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,202 @@
+"""On-demand sampling profiler producing flamegraph-compatible stacks."""
+
+import asyncio
+import signal
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Literal, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+ProfileMode = Literal["wall", "cpu"]
+
+# Deepest stack kept per sample; deeper frames are cut at the root side.
+MAX_STACK_DEPTH = 128
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profiling session is already running."""
+
+
+class ProfilerUnavailable(Exception):
+    """Raised when the requested mode can't run in this process."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", code.co_filename)
+    return f"{module}:{code.co_name}:{frame.f_lineno}"
+
+
+def collapse(frame: Optional[FrameType]) -> str:
+    """Render a stack as ``root;...;leaf``, the collapsed-stack format."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class ProfileSession:
+    """
+    One profiling run, sampling stacks at a fixed interval.
+
+    In ``wall`` mode a background thread samples every thread's stack,
+    including threads blocked on I/O such as the Odoo workers waiting for
+    XML-RPC responses. In ``cpu`` mode ``SIGPROF`` fires after each
+    ``interval`` of CPU time consumed by the process and samples the main
+    thread, which runs the event loop; it needs a Unix platform and to be
+    started from the main thread.
+
+    When ``path`` is set, samples are only kept while a request whose path
+    starts with it is being handled, and the session ends after ``requests``
+    such requests.
+    """
+
+    def __init__(
+        self,
+        mode: ProfileMode = "wall",
+        interval: float = 0.005,
+        path: Optional[str] = None,
+        requests: Optional[int] = None,
+    ):
+        self.mode = mode
+        self.interval = interval
+        self.path = path
+        self.requests = requests
+        self.samples: Counter = Counter()
+        self.completed = 0
+        self._active = 0
+        self._stopped = threading.Event()
+        self._done: Optional[asyncio.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self._previous_handler = None
+
+    # Request scoping
+
+    def matches(self, path: str) -> bool:
+        return self.path is not None and path.startswith(self.path)
+
+    @property
+    def sampling(self) -> bool:
+        return self.path is None or self._active > 0
+
+    def request_started(self):
+        self._active += 1
+
+    def request_finished(self):
+        self._active -= 1
+        self.completed += 1
+        if self.requests is not None and self.completed >= self.requests:
+            self._done.set()
+
+    # Sampling
+
+    def _sample_threads(self):
+        own = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            if not self.sampling:
+                continue
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self.samples[collapse(frame)] += 1
+
+    def _on_sigprof(self, signum: int, frame: Optional[FrameType]):
+        if self.sampling and frame is not None:
+            self.samples[collapse(frame)] += 1
+
+    def start(self):
+        self._done = asyncio.Event()
+        if self.mode == "cpu":
+            if not hasattr(signal, "ITIMER_PROF"):
+                raise ProfilerUnavailable("CPU profiling needs ITIMER_PROF")
+            if threading.current_thread() is not threading.main_thread():
+                raise ProfilerUnavailable(
+                    "CPU profiling needs the event loop in the main thread"
+                )
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_sigprof)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._thread = threading.Thread(
+                target=self._sample_threads, name="profiler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self.mode == "cpu":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        elif self._thread is not None:
+            self._thread.join()
+
+    async def run(self, seconds: float) -> str:
+        """
+        Sample for ``seconds``, or until the requested number of matching
+        requests completed if that comes first.
+
+        Returns:
+            str: One ``stack count`` line per distinct stack, the input
+            format of flamegraph.pl, speedscope and similar tools
+        """
+        self.start()
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.stop()
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+
+class Profiler:
+    """Holder of the single profiling session allowed at a time."""
+
+    def __init__(self):
+        self.session: Optional[ProfileSession] = None
+
+    async def profile(self, session: ProfileSession, seconds: float) -> str:
+        """
+        Run a profiling session.
+
+        Raises:
+            ProfilerBusy: If another session is running
+            ProfilerUnavailable: If the session's mode can't run here
+        """
+        if self.session is not None:
+            raise ProfilerBusy("A profiling session is already running")
+        self.session = session
+        try:
+            return await session.run(seconds)
+        finally:
+            self.session = None
+
+
+profiler = Profiler()
+
+
+class ProfilingMiddleware:
+    """Mark the requests a path-scoped profiling session samples."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        session = profiler.session
+        if (
+            scope["type"] != "http"
+            or session is None
+            or not session.matches(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        session.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session.request_finished()
@@ -0,0 +1,69 @@
+"""In-process rate limiting."""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class SlidingWindowLimiter:
+    """
+    Allow at most ``limit`` hits per key within a sliding ``window`` seconds.
+
+    Keys that saw no hit for a whole window are forgotten once more than
+    ``max_keys`` keys are tracked, so memory stays bounded under key churn.
+    """
+
+    def __init__(self, limit: int, window: float, max_keys: int = 10000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._hits: Dict[str, Deque[float]] = {}
+
+    def _prune(self, now: float):
+        stale = [
+            k
+            for k, hits in self._hits.items()
+            if not hits or hits[-1] <= now - self.window
+        ]
+        for key in stale:
+            del self._hits[key]
+
+    def _retry_after(self, key: str, now: float) -> Optional[float]:
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            return hits[0] + self.window - now
+        return None
+
+    def check(self, key: str) -> Optional[float]:
+        """
+        Tell whether a key may hit now, without recording a hit.
+
+        Returns:
+            Optional[float]: None if a hit would be allowed, otherwise the
+            number of seconds until the key may try again
+        """
+        return self._retry_after(key, time.monotonic())
+
+    def hit(self, key: str) -> Optional[float]:
+        """
+        Record a hit for a key.
+
+        Returns:
+            Optional[float]: None if the hit is allowed, otherwise the number
+            of seconds until the key may try again (the hit isn't recorded)
+        """
+        now = time.monotonic()
+        retry_after = self._retry_after(key, now)
+        if retry_after is not None:
+            return retry_after
+        hits = self._hits.get(key)
+        if hits is None:
+            if len(self._hits) >= self.max_keys:
+                self._prune(now)
+            hits = self._hits[key] = deque()
+        hits.append(now)
+        return None
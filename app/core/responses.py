@@ -0,0 +1,144 @@
+"""Response rendering for Odoo records."""
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter, create_model
+
+from .config import settings
+from .metrics import timed
+
+
+class RawJSONResponse(Response):
+    """JSON response whose body has already been encoded to bytes."""
+
+    media_type = "application/json"
+
+
+def flatten(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace Odoo's many2one ``[id, name]`` pairs with the bare id."""
+    return {
+        key: value[0] if isinstance(value, list) and len(value) == 2 else value
+        for key, value in record.items()
+    }
+
+
+# Sparse response adapters kept; each distinct field selection builds one.
+SPARSE_ADAPTER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def get_adapter(annotation: Any) -> TypeAdapter:
+    """
+    Return the compiled TypeAdapter of a route's response type, built once.
+
+    Only for the fixed annotations of the routes; field selections go
+    through the bounded ``response_adapter`` cache.
+    """
+    return TypeAdapter(annotation)
+
+
+def sparse_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Derive a response model limited to a set of selected fields.
+
+    Fields of the base model that weren't selected become optional, and
+    selected fields the base model doesn't declare are passed through as
+    is. The base model's validators still apply to the fields it declares.
+    """
+    overrides = {
+        name: (Optional[Any], None)
+        for name in model.model_fields
+        if name not in fields and name != "id"
+    }
+    extras = {name: (Any, None) for name in fields if name not in model.model_fields}
+    return create_model(
+        f"{model.__name__}Fields", __base__=model, **overrides, **extras
+    )
+
+
+def sparse_annotation(annotation: Any, fields: Sequence[str]) -> Any:
+    """Apply sparse_model to a response type, either ``Model`` or ``List[Model]``."""
+    if get_origin(annotation) is list:
+        return List[sparse_model(get_args(annotation)[0], tuple(fields))]
+    return sparse_model(annotation, tuple(fields))
+
+
+@lru_cache(maxsize=SPARSE_ADAPTER_CACHE_SIZE)
+def _sparse_adapter(annotation: Any, fields: Tuple[str, ...]) -> TypeAdapter:
+    return TypeAdapter(sparse_annotation(annotation, fields))
+
+
+def response_adapter(
+    annotation: Any, fields: Optional[Sequence[str]] = None
+) -> TypeAdapter:
+    """
+    Return the TypeAdapter rendering a response type.
+
+    Field selections are canonicalized, so ``name,email`` and ``email,name``
+    share an adapter, and their adapters and derived models live in one
+    bounded LRU cache, as clients choose them freely.
+
+    Args:
+        annotation: The route's response type, e.g. ``List[Product]``
+        fields: Fields selected by the client, if any
+    """
+    if fields is None:
+        return get_adapter(annotation)
+    return _sparse_adapter(annotation, tuple(sorted(set(fields))))
+
+
+def render(
+    content: Any,
+    annotation: Any,
+    response: Optional[Response] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Any:
+    """
+    Render endpoint content, taking the fast path when it's enabled.
+
+    By default the content is returned as is and FastAPI validates it
+    against the route's ``response_model`` and encodes it with
+    ``jsonable_encoder`` and the stdlib JSON encoder. With
+    ``fast_serialization`` on, it's validated by a precompiled TypeAdapter
+    and encoded straight to JSON bytes by pydantic-core instead, which
+    produces the same output at a fraction of the per-row cost.
+
+    When the client selected a sparse fieldset, the content can't match the
+    route's ``response_model``; it's always rendered through the fast path
+    with a model derived from the selected fields, leaving out the others.
+    Fields missing from the content, like optional embedded records, are
+    left out on the fast path, as with ``response_model_exclude_unset``.
+
+    Args:
+        content: Records as returned by Odoo
+        annotation: The route's response type, e.g. ``List[Product]``
+        response: The endpoint's response parameter, whose headers are kept
+        fields: Fields selected by the client, if any
+
+    Returns:
+        The content itself, or a RawJSONResponse on the fast path
+    """
+    if fields is None and not settings.fast_serialization:
+        return content
+
+    adapter = response_adapter(annotation, fields)
+    with timed("validate"):
+        validated = adapter.validate_python(content)
+    with timed("encode"):
+        body = adapter.dump_json(validated, exclude_unset=True)
+    fast_response = RawJSONResponse(body)
+    if response is not None:
+        fast_response.headers.raw.extend(response.headers.raw)
+    return fast_response
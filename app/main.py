@@ -13,10 +13,31 @@ Attributes:
     settings: Application configuration settings
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from .api.v1.router import api_router
+from .core.compression import CompressionMiddleware
 from .core.config import settings
+from .core.metrics import MetricsMiddleware, registry
+from .core.profiler import ProfilingMiddleware
+from .services.odoo import odoo
+from .services.replica import replica
+from .services.watcher import watcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the replica sync and release shared resources on shutdown."""
+    if settings.replica_enabled:
+        replica.start()
+    yield
+    replica.close()
+    watcher.close()
+    odoo.close()
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -24,8 +45,16 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# Added innermost, so compression time counts in the request metrics
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+app.add_middleware(ProfilingMiddleware)
+if settings.metrics_enabled or settings.slow_request_threshold is not None:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
 
@@ -61,3 +90,37 @@ async def root():
         "api_version": "v1",
         "api_prefix": settings.api_v1_prefix,
     }
+
+
+@app.get("/health")
+async def health():
+    """
+    Health endpoint reporting Odoo reachability and connection pool usage.
+
+    Returns:
+        dict: Odoo status, the XML-RPC connection pool statistics and, when
+            enabled, the size and age of the local replica
+    """
+    status = await odoo.health()
+    if settings.replica_enabled:
+        status["replica"] = replica.stats()
+    return status
+
+
+@app.get("/metrics", include_in_schema=settings.metrics_enabled)
+async def metrics():
+    """
+    Metrics endpoint in the Prometheus text exposition format.
+
+    Exposes per-route request counts and latency histograms, the time spent
+    per request phase, in-flight gauges, and per model and method Odoo call
+    counts and latency histograms.
+
+    Returns:
+        PlainTextResponse: The current value of every metric
+    """
+    if not settings.metrics_enabled:
+        return PlainTextResponse("Metrics are disabled", status_code=404)
+    return PlainTextResponse(
+        registry.expose(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
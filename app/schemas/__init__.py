@@ -5,11 +5,15 @@ This module exports all schemas to make them easily importable
 from other parts of the application.
 """
 
+from .batch import BatchRequest, SubRequest, SubResponse
+from .changes import ChangeFeed
 from .partner import Partner, PartnerCreate, PartnerUpdate
 from .product import Product, ProductCreate, ProductUpdate
 from .sale import SaleOrder, SaleOrderBase, SaleOrderLineBase
 
 __all__ = [
+    "BatchRequest",
+    "ChangeFeed",
     "Partner",
     "PartnerCreate",
     "PartnerUpdate",
@@ -19,4 +23,6 @@ __all__ = [
     "SaleOrder",
     "SaleOrderBase",
     "SaleOrderLineBase",
+    "SubRequest",
+    "SubResponse",
 ]
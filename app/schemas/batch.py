@@ -0,0 +1,47 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SubRequest(BaseModel):
+    """
+    Schema for one read within a batch.
+
+    Attributes:
+        id: Optional client reference echoed in the matching result
+        path: Path and query string relative to the API prefix, e.g.
+            ``/products/42?fields=name``
+        headers: Extra request headers, e.g. ``If-None-Match``
+    """
+
+    id: Optional[str] = None
+    path: str = Field(..., min_length=1)
+    headers: Dict[str, str] = {}
+
+
+class BatchRequest(BaseModel):
+    """
+    Schema for a batch of reads executed in one call.
+
+    Attributes:
+        requests: The reads to execute
+    """
+
+    requests: List[SubRequest] = Field(..., min_length=1)
+
+
+class SubResponse(BaseModel):
+    """
+    Schema for the result of one read within a batch.
+
+    Attributes:
+        id: The client reference of the sub-request
+        status: HTTP status code of the read
+        headers: Response headers of the read, e.g. ``etag``
+        body: Decoded response body, null when empty
+    """
+
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str]
+    body: Any = None
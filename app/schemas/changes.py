@@ -0,0 +1,19 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ChangeFeed(BaseModel):
+    """
+    Schema for a page of the incremental change feed.
+
+    Attributes:
+        records: Records created or modified after the requested watermark,
+            oldest first
+        next_watermark: Watermark to pass as ``since`` to get the next changes
+        has_more: Whether more changes are already available
+    """
+
+    records: List[Dict[str, Any]]
+    next_watermark: Optional[str] = None
+    has_more: bool
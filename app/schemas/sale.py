@@ -4,6 +4,9 @@ from typing import Any, List, Optional, Union
 
 from pydantic import BaseModel, condecimal, field_validator
 
+from .partner import Partner
+from .product import Product
+
 
 class SaleOrderLineBase(BaseModel):
     """
@@ -14,12 +17,14 @@ class SaleOrderLineBase(BaseModel):
         product_uom_qty: Quantity ordered
         price_unit: Unit price
         price_subtotal: Subtotal for this line
+        product: The product variant, when expanded
     """
 
     product_id: int
     product_uom_qty: condecimal(ge=Decimal("0"))
     price_unit: condecimal(ge=Decimal("0"))
     price_subtotal: condecimal(ge=Decimal("0"))
+    product: Optional[Product] = None
 
     @field_validator("product_id", mode="before")
     @classmethod
@@ -65,11 +70,13 @@ class SaleOrder(SaleOrderBase):
         id: The unique identifier for the sale order
         name: The order reference number
         order_lines: List of order lines
+        partner: The customer, when expanded
     """
 
     id: int
     name: str
     order_lines: List[SaleOrderLineBase]
+    partner: Optional[Partner] = None
 
     class Config:
         """Pydantic config for the SaleOrder model."""
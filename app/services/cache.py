@@ -0,0 +1,104 @@
+"""Read-through cache for Odoo reads."""
+
+import json
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def make_key(model: str, method: str, *args: Any) -> str:
+    """
+    Build a stable cache key for an Odoo call.
+
+    Domains given as tuples or lists produce the same key.
+    """
+    return json.dumps([model, method, *args], sort_keys=True, default=str)
+
+
+class CacheBackend(ABC):
+    """
+    Interface for cache backends used by OdooService.
+
+    Values are opaque to the backend. Implementations must hand out copies,
+    since callers are free to mutate what they get back.
+    """
+
+    @abstractmethod
+    def get(self, model: str, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, model: str, key: str, value: Any, ttl: float):
+        """Store a value for ``ttl`` seconds."""
+
+    @abstractmethod
+    def invalidate(self, model: Optional[str] = None):
+        """Drop every entry of a model, or everything when no model is given."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return backend counters."""
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache bounded by the size of the stored values.
+
+    Values are pickled on write, which both measures their size against
+    ``max_bytes`` and gives every reader an independent copy.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, float, bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def _drop(self, key: str):
+        _, _, payload = self._entries.pop(key)
+        self._bytes -= len(payload)
+
+    def get(self, model: str, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        if entry[1] <= time.monotonic():
+            self._drop(key)
+            self._counters["expirations"] += 1
+            self._counters["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._counters["hits"] += 1
+        return pickle.loads(entry[2])
+
+    def set(self, model: str, key: str, value: Any, ttl: float):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (model, time.monotonic() + ttl, payload)
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._counters["evictions"] += 1
+
+    def invalidate(self, model: Optional[str] = None):
+        if model is None:
+            self._entries.clear()
+            self._bytes = 0
+            return
+        for key in [k for k, entry in self._entries.items() if entry[0] == model]:
+            self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            **self._counters,
+        }
@@ -1,30 +1,115 @@
-from typing import Any, Dict, List, Optional
-from xmlrpc import client
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
 from fastapi import HTTPException
 
 from ..core.config import settings
+from ..core.metrics import odoo_call, record_cache_lookup
+from .cache import CacheBackend, MemoryCache, make_key
+from .pool import ConnectionPool, PoolTimeout
+from .singleflight import SingleFlight
 
 
 class OdooService:
-    def __init__(self):
+    def __init__(self, cache: Optional[CacheBackend] = None):
         self.url = settings.odoo_url
         self.db = settings.odoo_db
         self.username = settings.odoo_username
         self.password = settings.odoo_password
+        self.timeout = settings.odoo_timeout
         self._uid = None
-        self._models = None
+        self._uid_lock = threading.Lock()
+        # XML-RPC is blocking, so every call runs on a bounded pool of worker
+        # threads, each checking a keep-alive connection out of the pool.
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.odoo_max_workers, thread_name_prefix="odoo-rpc"
+        )
+        self.pool = ConnectionPool(
+            self.url,
+            size=settings.odoo_pool_size,
+            idle_timeout=settings.odoo_pool_idle_timeout,
+            timeout=self.timeout,
+        )
+        # Reads of models listed in cache_ttls are served from the cache
+        # until their TTL runs out or the model is invalidated.
+        self.cache = cache or MemoryCache(max_bytes=settings.cache_max_bytes)
+        self.cache_ttls = settings.cache_ttls if settings.cache_enabled else {}
+        # Identical reads already in flight share a single upstream call.
+        self._flight = SingleFlight()
+        # fields_get results; model schemas only change on module upgrades.
+        self._fields_meta: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
     def _connect(self):
-        if not self._uid:
-            common = client.ServerProxy(f"{self.url}/xmlrpc/2/common")
-            self._uid = common.authenticate(self.db, self.username, self.password, {})
+        if self._uid:
+            return
+        with self._uid_lock:
             if not self._uid:
-                raise HTTPException(
-                    status_code=401, detail="Odoo authentication failed"
-                )
+                with self.pool.connection() as conn:
+                    uid = conn.common.authenticate(
+                        self.db, self.username, self.password, {}
+                    )
+                if not uid:
+                    raise HTTPException(
+                        status_code=401, detail="Odoo authentication failed"
+                    )
+                self._uid = uid
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """Run a blocking XML-RPC call in the worker pool with a timeout."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, partial(func, *args))
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except (asyncio.TimeoutError, PoolTimeout):
+            raise HTTPException(status_code=504, detail="Odoo request timed out")
+
+    def _execute_kw(
+        self, model: str, method: str, args: List, kwargs: Dict[str, Any]
+    ) -> Any:
+        self._connect()
+        with self.pool.connection() as conn:
+            return conn.object.execute_kw(
+                self.db, self._uid, self.password, model, method, args, kwargs
+            )
+
+    async def execute_kw(
+        self,
+        model: str,
+        method: str,
+        args: List,
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Call a model method on Odoo without blocking the event loop."""
+        with odoo_call(model, method):
+            return await self._run(self._execute_kw, model, method, args, kwargs or {})
+
+    async def _search_read_chunked(
+        self, model: str, domain: List, fields: List[str], kwargs: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for ids first, then read them in chunks concurrently.
 
-            self._models = client.ServerProxy(f"{self.url}/xmlrpc/2/object")
+        At most ``odoo_read_concurrency`` reads run at once, so a large pull
+        is spread over several Odoo workers without monopolising the pool.
+        Records are returned in the order of the search.
+        """
+        ids = await self.execute_kw(model, "search", [domain], kwargs)
+        size = settings.odoo_read_chunk_size
+        semaphore = asyncio.Semaphore(settings.odoo_read_concurrency)
+
+        async def read(chunk: List[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.execute_kw(model, "read", [chunk], {"fields": fields})
+
+        chunks = await asyncio.gather(
+            *(read(ids[i : i + size]) for i in range(0, len(ids), size))
+        )
+        by_id = {record["id"]: record for chunk in chunks for record in chunk}
+        # Records deleted between the search and the read are skipped.
+        return [by_id[id_] for id_ in ids if id_ in by_id]
 
     async def fetch_records(
         self,
@@ -32,33 +117,143 @@ class OdooService:
         domain: List[List],
         fields: List[str],
         limit: Optional[int] = None,
+        order: Optional[str] = None,
+        use_cache: bool = True,
+        chunked: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
-        """Generic function to fetch records from Odoo"""
-        try:
-            self._connect()
-            kwargs = {"fields": fields}
-            if limit:
-                kwargs["limit"] = limit
-
-            return self._models.execute_kw(
-                self.db,
-                self._uid,
-                self.password,
-                model,
-                "search_read",
-                [domain],
-                kwargs,
-            )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+        """
+        Generic function to fetch records from Odoo
+
+        Reads of models with a configured cache TTL are served from the cache
+        when possible. Pass ``use_cache=False`` to always go to Odoo.
+        Identical reads issued concurrently share one call to Odoo.
+
+        Reads with a limit above ``odoo_chunked_read_threshold`` are split
+        into a ``search`` followed by parallel ``read`` calls over id chunks;
+        ``chunked`` forces that mode on or off.
+        """
+        if chunked is None:
+            chunked = bool(limit and limit > settings.odoo_chunked_read_threshold)
+        ttl = self.cache_ttls.get(model) if use_cache else None
+        key = make_key(model, "search_read", domain, fields, limit, order)
+        if ttl:
+            cached = self.cache.get(model, key)
+            record_cache_lookup(model, cached is not None)
+            if cached is not None:
+                return cached
+
+        async def search_read() -> List[Dict[str, Any]]:
+            try:
+                kwargs = {}
+                if limit:
+                    kwargs["limit"] = limit
+                if order:
+                    kwargs["order"] = order
+
+                if chunked:
+                    records = await self._search_read_chunked(
+                        model, domain, fields, kwargs
+                    )
+                else:
+                    records = await self.execute_kw(
+                        model, "search_read", [domain], {"fields": fields, **kwargs}
+                    )
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+            if ttl:
+                self.cache.set(model, key, records, ttl)
+            return records
 
-    def authenticate(self, username: str, password: str) -> bool:
+        return await self._flight.do(key, search_read)
+
+    async def fields_get(self, model: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the field metadata of a model.
+
+        Metadata is fetched once per model and kept for the process lifetime.
+        """
+        if model not in self._fields_meta:
+
+            async def fetch() -> Dict[str, Dict[str, Any]]:
+                try:
+                    return await self.execute_kw(
+                        model, "fields_get", [], {"attributes": ["type", "string"]}
+                    )
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=str(e))
+
+            meta = await self._flight.do(make_key(model, "fields_get"), fetch)
+            self._fields_meta[model] = meta
+        return self._fields_meta[model]
+
+    async def read_group(
+        self,
+        model: str,
+        domain: List,
+        fields: List[str],
+        groupby: List[str],
+        orderby: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate records of a model on the Odoo side.
+
+        Groups are computed non-lazily, i.e. over all ``groupby`` fields at
+        once. Identical concurrent aggregations share one call to Odoo.
+        """
+        kwargs = {"lazy": False}
+        if orderby:
+            kwargs["orderby"] = orderby
+        if limit:
+            kwargs["limit"] = limit
+
+        async def read_group() -> List[Dict[str, Any]]:
+            try:
+                return await self.execute_kw(
+                    model, "read_group", [domain, fields, groupby], kwargs
+                )
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
+        key = make_key(model, "read_group", domain, fields, groupby, kwargs)
+        return await self._flight.do(key, read_group)
+
+    def invalidate_cache(self, model: Optional[str] = None):
+        """Drop cached reads of a model, or of every model."""
+        self.cache.invalidate(model)
+
+    def _authenticate(self, username: str, password: str) -> Any:
+        with self.pool.connection() as conn:
+            return conn.common.authenticate(self.db, username, password, {})
+
+    async def authenticate(self, username: str, password: str) -> bool:
         """Authenticate user against Odoo."""
-        common = client.ServerProxy(f"{self.url}/xmlrpc/2/common")
-        uid = common.authenticate(self.db, username, password, {})
+        with odoo_call("common", "authenticate"):
+            uid = await self._run(self._authenticate, username, password)
         if not uid:
             raise HTTPException(status_code=401, detail="Authentication failed")
         return True
 
+    async def health(self) -> Dict[str, Any]:
+        """Check Odoo reachability and report connection pool statistics."""
+        healthy = await self._run(self.pool.health_check)
+        return {
+            "odoo": "ok" if healthy else "unreachable",
+            "pool": self.pool.stats(),
+            "coalescing": self._flight.stats(),
+        }
+
+    def close(self):
+        """Release the worker threads and connections used for Odoo calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
 
 odoo = OdooService()
@@ -0,0 +1,154 @@
+"""Pool of persistent XML-RPC connections to Odoo."""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+from xmlrpc import client
+
+from .transport import make_transport
+
+
+class PooledConnection:
+    """
+    A keep-alive HTTP/1.1 connection to the Odoo host.
+
+    Both XML-RPC services share one transport, so ``common`` and ``object``
+    calls made through the same pooled connection reuse a single socket.
+    """
+
+    def __init__(self, url: str, timeout: Optional[float] = None):
+        self.transport = make_transport(url, timeout)
+        self.common = client.ServerProxy(
+            f"{url}/xmlrpc/2/common", transport=self.transport, allow_none=True
+        )
+        self.object = client.ServerProxy(
+            f"{url}/xmlrpc/2/object", transport=self.transport, allow_none=True
+        )
+        self.last_used = time.monotonic()
+
+    def close(self):
+        self.transport.close()
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available in time."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent connections.
+
+    Connections are handed out most-recently-used first so warm sockets are
+    preferred, and connections idle for longer than ``idle_timeout`` seconds
+    are closed instead of being reused. A connection whose call failed at the
+    transport level is discarded; an Odoo ``Fault`` means the server answered,
+    so that connection goes back to the pool.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        size: int = 10,
+        idle_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+    ):
+        self.url = url
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle: Deque[PooledConnection] = deque()
+        self._open = 0
+        self._cond = threading.Condition()
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "evicted": 0,
+            "discarded": 0,
+            "waits": 0,
+        }
+
+    def _evict_expired(self):
+        """Close idle connections past their idle timeout (lock held)."""
+        now = time.monotonic()
+        while self._idle and now - self._idle[0].last_used > self.idle_timeout:
+            self._idle.popleft().close()
+            self._open -= 1
+            self._stats["evicted"] += 1
+
+    def acquire(self) -> PooledConnection:
+        """Check a connection out of the pool, opening one if allowed."""
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                self._evict_expired()
+                if self._idle:
+                    self._stats["reused"] += 1
+                    return self._idle.pop()
+                if self._open < self.size:
+                    self._open += 1
+                    self._stats["created"] += 1
+                    break
+                self._stats["waits"] += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeout("Timed out waiting for an Odoo connection")
+                self._cond.wait(remaining)
+        return PooledConnection(self.url, self.timeout)
+
+    def release(self, conn: PooledConnection):
+        """Return a healthy connection to the pool."""
+        conn.last_used = time.monotonic()
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def discard(self, conn: PooledConnection):
+        """Close a broken connection and free its slot."""
+        conn.close()
+        with self._cond:
+            self._open -= 1
+            self._stats["discarded"] += 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        except client.Fault:
+            self.release(conn)
+            raise
+        except BaseException:
+            self.discard(conn)
+            raise
+        else:
+            self.release(conn)
+
+    def health_check(self) -> bool:
+        """Ping Odoo over a pooled connection and prune expired ones."""
+        try:
+            with self.connection() as conn:
+                conn.common.version()
+        except Exception:
+            return False
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            self._evict_expired()
+            return {
+                "size": self.size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._open - len(self._idle),
+                **self._stats,
+            }
+
+    def close(self):
+        """Close every idle connection."""
+        with self._cond:
+            while self._idle:
+                self._idle.pop().close()
+                self._open -= 1
@@ -0,0 +1,421 @@
+"""Local read replica of frequently read Odoo models."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..core.config import settings
+from ..core.constants import PARTNER_FIELDS, PRODUCT_FIELDS, SEARCH_FIELDS
+from ..core.pagination import fetch_after
+from .odoo import odoo
+
+logger = logging.getLogger(__name__)
+
+# Models mirrored by the replica and the fields stored for each of them.
+REPLICATED_MODELS = {
+    "product.template": PRODUCT_FIELDS,
+    "res.partner": PARTNER_FIELDS,
+}
+
+# Records fetched per call while syncing.
+SYNC_BATCH_SIZE = 500
+
+# Domain of the sync, which also follows records as they're archived.
+SYNC_DOMAIN = ["|", ("active", "=", True), ("active", "=", False)]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    model TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (model, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_state (
+    model TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL
+);
+"""
+
+
+def _search_table(model: str) -> str:
+    return "search_" + model.replace(".", "_")
+
+
+def _match_expression(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix."""
+    return " ".join('"%s"*' % word.replace('"', '""') for word in text.split())
+
+
+def _like_condition(fields: List[str]) -> str:
+    """SQL matching a LIKE pattern against the text value of any of ``fields``."""
+    return " OR ".join(
+        f"(json_type(data, '$.{field}') = 'text' "
+        f"AND json_extract(data, '$.{field}') LIKE ? ESCAPE '\\')"
+        for field in fields
+    )
+
+
+def _like_pattern(text: str) -> str:
+    """Turn free text into a LIKE pattern matching it literally anywhere."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _simple_query(domain: List, order: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Recognize the reads the replica can answer.
+
+    Those are the id-ordered list pages (``[]`` or ``[("id", ">", n)]``) and
+    single-record lookups (``[("id", "=", n)]``).
+
+    Returns:
+        Optional[Dict]: The id condition, or None for any other read
+    """
+    if not domain:
+        return {"op": ">", "id": 0} if order == "id asc" else None
+    if len(domain) != 1 or len(domain[0]) != 3:
+        return None
+    field, op, value = domain[0]
+    if field != "id" or not isinstance(value, int) or isinstance(value, bool):
+        return None
+    if op == ">" and order == "id asc":
+        return {"op": ">", "id": value}
+    if op == "=":
+        return {"op": "=", "id": value}
+    return None
+
+
+class Replica:
+    """
+    SQLite copy of product templates and partners with a full-text index.
+
+    A background task follows each model's ``(write_date, id)`` watermark
+    through OdooService, archived records included, and upserts what
+    changed, dropping the archived ones; every few rounds it also lists the
+    live ids to drop deleted records. Reads are only served while both the
+    last successful sync and the last deletion scan are within
+    ``max_staleness`` seconds, so an unreachable Odoo makes the API fall
+    back to live reads (and their errors) instead of serving arbitrarily
+    old data.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        sync_interval: float = 10.0,
+        max_staleness: float = 60.0,
+        reconcile_every: int = 30,
+    ):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.max_staleness = max_staleness
+        self.reconcile_every = reconcile_every
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._synced_at: Dict[str, float] = {}
+        self._reconciled_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.fts = True
+
+    def _open(self) -> sqlite3.Connection:
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.executescript(_SCHEMA)
+            for model in REPLICATED_MODELS:
+                try:
+                    db.execute(
+                        f"CREATE VIRTUAL TABLE IF NOT EXISTS {_search_table(model)} "
+                        "USING fts5(body)"
+                    )
+                except sqlite3.OperationalError:
+                    # SQLite built without FTS5: search scans with LIKE instead.
+                    self.fts = False
+            db.commit()
+            self._db = db
+        return self._db
+
+    # Sync
+
+    def _watermark(self, model: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = (
+                self._open()
+                .execute("SELECT watermark FROM sync_state WHERE model = ?", (model,))
+                .fetchone()
+            )
+        return json.loads(row[0]) if row else None
+
+    def _store(self, model: str, records: List[Dict], watermark: Dict[str, Any]):
+        table = _search_table(model)
+        archived = [(model, r["id"]) for r in records if r.get("active") is False]
+        records = [record for record in records if record.get("active") is not False]
+        with self._lock:
+            db = self._open()
+            with db:
+                db.executemany(
+                    "DELETE FROM records WHERE model = ? AND id = ?", archived
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO records (model, id, data) VALUES (?, ?, ?)",
+                    [
+                        (model, record["id"], json.dumps(record, default=str))
+                        for record in records
+                    ],
+                )
+                if self.fts:
+                    ids = [(record["id"],) for record in records]
+                    ids += [(record_id,) for _, record_id in archived]
+                    db.executemany(f"DELETE FROM {table} WHERE rowid = ?", ids)
+                    db.executemany(
+                        f"INSERT INTO {table} (rowid, body) VALUES (?, ?)",
+                        [
+                            (
+                                record["id"],
+                                " ".join(
+                                    str(record[field])
+                                    for field in SEARCH_FIELDS[model]
+                                    if record.get(field)
+                                ),
+                            )
+                            for record in records
+                        ],
+                    )
+                db.execute(
+                    "INSERT OR REPLACE INTO sync_state (model, watermark) VALUES (?, ?)",
+                    (model, json.dumps(watermark)),
+                )
+
+    def _retain(self, model: str, live_ids: List[int]):
+        """Delete every local record of ``model`` missing from ``live_ids``."""
+        live = set(live_ids)
+        with self._lock:
+            db = self._open()
+            local = [
+                row[0]
+                for row in db.execute(
+                    "SELECT id FROM records WHERE model = ?", (model,)
+                )
+            ]
+            gone = [(model, record_id) for record_id in local if record_id not in live]
+            if not gone:
+                return
+            with db:
+                db.executemany("DELETE FROM records WHERE model = ? AND id = ?", gone)
+                if self.fts:
+                    db.executemany(
+                        f"DELETE FROM {_search_table(model)} WHERE rowid = ?",
+                        [(record_id,) for _, record_id in gone],
+                    )
+
+    async def sync(self, model: str):
+        """Copy every record of ``model`` changed since the stored watermark."""
+        fields = REPLICATED_MODELS[model] + ["write_date", "active"]
+        watermark = await asyncio.to_thread(self._watermark, model)
+        fetch = partial(odoo.fetch_records, model=model, fields=fields, use_cache=False)
+        while True:
+            records, watermark, has_more = await fetch_after(
+                fetch, SYNC_DOMAIN, "write_date", watermark, SYNC_BATCH_SIZE
+            )
+            if records:
+                await asyncio.to_thread(self._store, model, records, watermark)
+            if not has_more:
+                break
+        self._synced_at[model] = time.monotonic()
+
+    async def reconcile(self, model: str):
+        """Drop local records deleted or archived in Odoo since they were copied."""
+        started_at = time.monotonic()
+        live_ids = await odoo.execute_kw(model, "search", [[]])
+        await asyncio.to_thread(self._retain, model, live_ids)
+        self._reconciled_at[model] = started_at
+
+    def _reconcile_due(self, model: str, rounds: int) -> bool:
+        """
+        Whether to scan for deleted records this round.
+
+        Scans run every ``reconcile_every`` rounds, and more often when
+        needed to keep the last scan within ``max_staleness``.
+        """
+        reconciled_at = self._reconciled_at.get(model)
+        if reconciled_at is None or rounds % self.reconcile_every == 0:
+            return True
+        age = time.monotonic() - reconciled_at
+        return age + self.sync_interval > self.max_staleness
+
+    async def _run(self):
+        rounds = 0
+        while True:
+            for model in REPLICATED_MODELS:
+                try:
+                    if self._reconcile_due(model, rounds):
+                        await self.reconcile(model)
+                    await self.sync(model)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Syncing the %s replica failed", model)
+            rounds += 1
+            await asyncio.sleep(self.sync_interval)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        self._synced_at.clear()
+        self._reconciled_at.clear()
+
+    # Reads
+
+    def is_fresh(self, model: str) -> bool:
+        """Whether ``model`` was fully synced and scanned within the staleness bound."""
+        now = time.monotonic()
+        return all(
+            checked_at is not None and now - checked_at <= self.max_staleness
+            for checked_at in (
+                self._synced_at.get(model),
+                self._reconciled_at.get(model),
+            )
+        )
+
+    def _query(self, sql: str, params: Sequence[Any]) -> List:
+        with self._lock:
+            return self._open().execute(sql, params).fetchall()
+
+    def _project(self, rows: List, fields: List[str]) -> List[Dict]:
+        records = []
+        for row in rows:
+            data = json.loads(row[0])
+            records.append({"id": data["id"], **{f: data[f] for f in fields}})
+        return records
+
+    async def read(
+        self, model: str, domain: List, fields: List[str], limit: Optional[int], order
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer a read from the replica when it can.
+
+        The query runs on a worker thread, where it may wait for a sync to
+        finish writing without holding up the event loop.
+
+        Returns:
+            Optional[List[Dict]]: The records, or None when the read must go
+            to Odoo (model not replicated or stale, fields not stored, or a
+            domain or order the replica doesn't evaluate)
+        """
+        stored = REPLICATED_MODELS.get(model)
+        if stored is None or not self.is_fresh(model):
+            return None
+        if any(field not in stored + ["id", "write_date"] for field in fields):
+            return None
+        query = _simple_query(domain, order)
+        if query is None:
+            return None
+        sql = f"SELECT data FROM records WHERE model = ? AND id {query['op']} ?"
+        params: List[Any] = [model, query["id"]]
+        if query["op"] == ">":
+            sql += " ORDER BY id"
+            if limit:
+                sql += " LIMIT ?"
+                params.append(limit)
+        rows = await asyncio.to_thread(self._query, sql, params)
+        return self._project(rows, [f for f in fields if f != "id"])
+
+    async def search(self, model: str, text: str, limit: int) -> Optional[List[Dict]]:
+        """
+        Full-text search over the replicated name and code fields.
+
+        Every word of ``text`` is matched as a prefix and results are ranked
+        by relevance. Returns None when the replica can't serve the model.
+        As with ``read``, the query runs on a worker thread.
+        """
+        if model not in REPLICATED_MODELS or not self.is_fresh(model):
+            return None
+        if not text.split():
+            return []
+        if self.fts:
+            table = _search_table(model)
+            sql = (
+                f"SELECT r.data FROM {table} s JOIN records r "
+                "ON r.model = ? AND r.id = s.rowid "
+                f"WHERE {table} MATCH ? ORDER BY s.rank LIMIT ?"
+            )
+            params = (model, _match_expression(text), limit)
+        else:
+            fields = SEARCH_FIELDS[model]
+            sql = (
+                "SELECT data FROM records WHERE model = ? "
+                f"AND ({_like_condition(fields)}) ORDER BY id LIMIT ?"
+            )
+            params = (model, *[_like_pattern(text)] * len(fields), limit)
+        rows = await asyncio.to_thread(self._query, sql, params)
+        return self._project(rows, REPLICATED_MODELS[model])
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            counts = dict(
+                self._open()
+                .execute("SELECT model, COUNT(*) FROM records GROUP BY model")
+                .fetchall()
+            )
+        return {
+            model: {
+                "records": counts.get(model, 0),
+                "fresh": self.is_fresh(model),
+                "age": (
+                    round(now - self._synced_at[model], 3)
+                    if model in self._synced_at
+                    else None
+                ),
+            }
+            for model in REPLICATED_MODELS
+        }
+
+
+async def fetch_records(
+    model: str,
+    domain: List,
+    fields: List[str],
+    limit: Optional[int] = None,
+    order: Optional[str] = None,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Read records from the replica when enabled and fresh, otherwise from Odoo.
+
+    Takes the same arguments as ``OdooService.fetch_records``; with
+    ``use_cache=False`` both the replica and the cache are skipped.
+    """
+    if settings.replica_enabled and use_cache:
+        records = await replica.read(model, domain, fields, limit, order)
+        if records is not None:
+            return records
+    return await odoo.fetch_records(
+        model=model,
+        domain=domain,
+        fields=fields,
+        limit=limit,
+        order=order,
+        use_cache=use_cache,
+    )
+
+
+replica = Replica(
+    path=settings.replica_path,
+    sync_interval=settings.replica_sync_interval,
+    max_staleness=settings.replica_max_staleness,
+    reconcile_every=settings.replica_reconcile_every,
+)
@@ -0,0 +1,42 @@
+"""Coalescing of identical concurrent calls."""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between every caller asking for the same key.
+
+    The first caller starts the call; callers arriving before it completes
+    wait for the same result instead of issuing their own. Each waiter gets
+    its own copy of the result, so callers may mutate what they receive.
+    A waiter being cancelled doesn't cancel the shared call.
+    """
+
+    def __init__(self):
+        # key -> [shared future, number of callers still waiting on it]
+        self._calls: Dict[str, List[Any]] = {}
+        self._counters = {"calls": 0, "shared": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        call = self._calls.get(key)
+        if call is None:
+            call = [asyncio.ensure_future(func()), 0]
+            self._calls[key] = call
+            call[0].add_done_callback(lambda _: self._calls.pop(key, None))
+            self._counters["calls"] += 1
+        else:
+            self._counters["shared"] += 1
+
+        call[1] += 1
+        try:
+            result = await asyncio.shield(call[0])
+        finally:
+            call[1] -= 1
+        # The last waiter to resume takes the original, the others a copy.
+        return result if call[1] == 0 else copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._calls), **self._counters}
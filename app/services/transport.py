@@ -0,0 +1,36 @@
+"""XML-RPC transports used to talk to Odoo."""
+
+import http.client
+from typing import Optional
+from xmlrpc import client
+
+
+class TimeoutTransport(client.Transport):
+    """
+    HTTP transport that applies a socket timeout to every Odoo call.
+
+    The stock transports block forever on an unresponsive server, which would
+    pin a worker thread indefinitely.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, use_https: bool = False):
+        super().__init__()
+        self.timeout = timeout
+        self.use_https = use_https
+
+    def make_connection(self, host):
+        if self._connection and host == self._connection[0]:
+            return self._connection[1]
+
+        chost, self._extra_headers, x509 = self.get_host_info(host)
+        if self.use_https:
+            connection = http.client.HTTPSConnection(chost, timeout=self.timeout)
+        else:
+            connection = http.client.HTTPConnection(chost, timeout=self.timeout)
+        self._connection = host, connection
+        return connection
+
+
+def make_transport(url: str, timeout: Optional[float] = None) -> TimeoutTransport:
+    """Build a transport matching the scheme of the given Odoo URL."""
+    return TimeoutTransport(timeout=timeout, use_https=url.startswith("https://"))
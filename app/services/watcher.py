@@ -0,0 +1,123 @@
+"""Shared background polling of Odoo record changes."""
+
+import asyncio
+import logging
+from functools import partial
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..core.pagination import encode_cursor, fetch_after, next_second
+from ..core.responses import flatten
+from .odoo import odoo
+
+logger = logging.getLogger(__name__)
+
+# Records fetched per call while catching up with a burst of changes.
+POLL_BATCH_SIZE = 200
+
+
+class ModelWatcher:
+    """
+    Poll one model for changes and fan them out to every subscriber.
+
+    However many clients subscribe, a single background task queries Odoo,
+    following a ``(write_date, id)`` watermark that starts after the most
+    recently changed records. The task starts with the first subscriber and
+    stops with the last one. Each subscriber has a bounded queue; a
+    subscriber too slow to keep up loses its oldest pending events.
+    """
+
+    def __init__(self, model: str, fields: List[str]):
+        self.model = model
+        self.fields = fields + ["write_date"]
+        self.watermark: Optional[Dict[str, Any]] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.stream_queue_size)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # The next subscriber starts from the changes made after it joins.
+            self.watermark = None
+
+    def _publish(self, event: Dict[str, Any]):
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _poll(self):
+        """Publish every change past the watermark, one event per batch."""
+        fetch = partial(
+            odoo.fetch_records, model=self.model, fields=self.fields, use_cache=False
+        )
+        if self.watermark is None:
+            latest = await fetch(domain=[], limit=1, order="write_date desc, id desc")
+            # Every record written up to the latest second is already there.
+            self.watermark = {
+                "id": 0,
+                "write_date": (
+                    next_second(latest[0]["write_date"])
+                    if latest
+                    else "1970-01-01 00:00:00"
+                ),
+            }
+            return
+
+        while True:
+            records, self.watermark, has_more = await fetch_after(
+                fetch, [], "write_date", self.watermark, POLL_BATCH_SIZE
+            )
+            if records:
+                self._publish(
+                    {
+                        "id": encode_cursor({"sort": "write_date", **self.watermark}),
+                        "records": [flatten(record) for record in records],
+                    }
+                )
+            if not has_more:
+                return
+
+    async def _run(self):
+        while True:
+            try:
+                await self._poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Polling %s for changes failed", self.model)
+            await asyncio.sleep(settings.stream_poll_interval)
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+
+class ChangeWatcher:
+    """Registry of the per-model watchers shared by all subscribers."""
+
+    def __init__(self):
+        self._watchers: Dict[Tuple[str, Tuple[str, ...]], ModelWatcher] = {}
+
+    def get(self, model: str, fields: List[str]) -> ModelWatcher:
+        key = (model, tuple(fields))
+        if key not in self._watchers:
+            self._watchers[key] = ModelWatcher(model, fields)
+        return self._watchers[key]
+
+    def close(self):
+        for model_watcher in self._watchers.values():
+            model_watcher.close()
+
+
+watcher = ChangeWatcher()
@@ -0,0 +1,373 @@
+"""
+Stand-in Odoo XML-RPC server for offline benchmarks.
+
+Serves ``/xmlrpc/2/common`` and ``/xmlrpc/2/object`` over an in-memory,
+generated dataset of partners, products and sale orders with their lines,
+and supports the calls OdooService makes: ``authenticate``, ``version`` and
+``execute_kw`` with ``search_read``, ``search``, ``search_count``, ``read``,
+``fields_get`` and ``read_group``. Every call sleeps for a configurable
+latency plus uniform jitter, and is counted per ``model.method``.
+
+Any login is accepted except the password ``bad``.
+
+Example:
+    python -m benchmarks.fake_odoo --port 8069 --records 1000 --latency 0.02
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, List, Optional
+from xmlrpc.client import Fault
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+FIELD_TYPES = {
+    bool: "boolean",
+    int: "integer",
+    float: "float",
+    list: "many2one",
+}
+
+AGGREGATES: Dict[str, Callable[[List], Any]] = {
+    "sum": sum,
+    "avg": lambda values: sum(values) / len(values),
+    "min": min,
+    "max": max,
+    "count_distinct": lambda values: len(set(values)),
+}
+
+# Characters of an Odoo datetime kept when grouping by a granularity.
+GRANULARITIES = {"year": 4, "month": 7, "day": 10}
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "=": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    "in": lambda a, b: a in b,
+    "not in": lambda a, b: a not in b,
+    "ilike": lambda a, b: str(b).lower() in str(a).lower(),
+    "not ilike": lambda a, b: str(b).lower() not in str(a).lower(),
+}
+
+
+def generate_dataset(records: int, seed: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build a dataset shaped like Odoo's ``search_read`` results.
+
+    Args:
+        records: Number of partners, products and sale orders; every order
+            has two lines
+        seed: Seed of the generated values
+
+    Returns:
+        Dict: Records per model
+    """
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+
+    def stamp(i: int) -> str:
+        return (base + timedelta(minutes=i)).strftime(ODOO_DATETIME_FORMAT)
+
+    partners = [
+        {
+            "id": i,
+            "name": f"Partner {i}",
+            "email": f"partner{i}@example.com",
+            "phone": f"+48 {rng.randint(100000000, 999999999)}",
+            "is_company": i % 4 == 0,
+            "create_date": stamp(0),
+            "write_date": stamp(i),
+        }
+        for i in range(1, records + 1)
+    ]
+    products = [
+        {
+            "id": i,
+            "name": f"Product {i}",
+            "list_price": round(rng.uniform(1, 500), 2),
+            "default_code": f"SKU{i:05d}" if i % 3 else False,
+            "active": True,
+            "create_date": stamp(0),
+            "write_date": stamp(i),
+        }
+        for i in range(1, records + 1)
+    ]
+    orders, lines = [], []
+    for i in range(1, records + 1):
+        partner = partners[rng.randrange(records)]
+        order_lines = []
+        for k in (1, 2):
+            product = products[rng.randrange(records)]
+            quantity = float(rng.randint(1, 10))
+            line = {
+                "id": i * 10 + k,
+                "order_id": [i, f"S{i:05d}"],
+                "product_id": [product["id"], product["name"]],
+                "order_partner_id": [partner["id"], partner["name"]],
+                "product_uom_qty": quantity,
+                "price_unit": product["list_price"],
+                "price_subtotal": round(quantity * product["list_price"], 2),
+                "state": "sale" if i % 2 else "draft",
+                "create_date": stamp(0),
+                "write_date": stamp(i),
+            }
+            order_lines.append(line)
+        lines += order_lines
+        total = round(sum(line["price_subtotal"] for line in order_lines), 2)
+        orders.append(
+            {
+                "id": i,
+                "name": f"S{i:05d}",
+                "date_order": stamp(i),
+                "partner_id": [partner["id"], partner["name"]],
+                "amount_total": total,
+                "amount_untaxed": total,
+                "amount_tax": 0.0,
+                "state": "sale" if i % 2 else "draft",
+                "invoice_status": "to invoice" if i % 2 else "no",
+                "order_line": [line["id"] for line in order_lines],
+                "create_date": stamp(0),
+                "write_date": stamp(i),
+            }
+        )
+    return {
+        "res.partner": partners,
+        "product.template": products,
+        # Variants mirror templates one to one.
+        "product.product": [dict(product) for product in products],
+        "sale.order": orders,
+        "sale.order.line": lines,
+    }
+
+
+def _value(value: Any) -> Any:
+    """Compare many2one values by id, as Odoo does in domains."""
+    if isinstance(value, list) and len(value) == 2 and isinstance(value[0], int):
+        return value[0]
+    return value
+
+
+def matches(record: Dict[str, Any], domain: List) -> bool:
+    """Evaluate a prefix-notation Odoo domain against a record."""
+    stack = []
+    for term in reversed(domain):
+        if term in ("&", "|"):
+            left, right = stack.pop(), stack.pop()
+            stack.append(left and right if term == "&" else left or right)
+        elif term == "!":
+            stack.append(not stack.pop())
+        else:
+            field, operator, operand = term
+            stack.append(OPERATORS[operator](_value(record.get(field)), operand))
+    return all(stack)
+
+
+def sort_records(records: List[Dict], order: Optional[str]) -> List[Dict]:
+    """Sort records by an Odoo ``order`` clause, e.g. ``write_date desc, id``."""
+    for part in reversed([p.strip() for p in (order or "id").split(",")]):
+        field, *direction = part.split()
+        records = sorted(
+            records,
+            key=lambda record: _value(record.get(field)),
+            reverse=bool(direction) and direction[0].lower() == "desc",
+        )
+    return records
+
+
+class FakeOdoo:
+    """
+    In-memory Odoo answering the XML-RPC calls made by OdooService.
+
+    Attributes:
+        data: Records per model; may be modified while serving
+        calls: Number of calls per ``model.method``
+    """
+
+    def __init__(
+        self,
+        records: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+    ):
+        self.data = generate_dataset(records, seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._server: Optional[SimpleXMLRPCServer] = None
+
+    def _call(self, name: str):
+        with self._lock:
+            self.calls[name] += 1
+            delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+    # XML-RPC methods
+
+    def authenticate(self, db: str, login: str, password: str, context: Dict) -> Any:
+        self._call("common.authenticate")
+        return 2 if password != "bad" else False
+
+    def version(self) -> Dict[str, Any]:
+        return {"server_version": "18.0", "server_serie": "18.0"}
+
+    def execute_kw(
+        self,
+        db: str,
+        uid: int,
+        password: str,
+        model: str,
+        method: str,
+        args: List,
+        kwargs: Optional[Dict] = None,
+    ) -> Any:
+        self._call(f"{model}.{method}")
+        kwargs = kwargs or {}
+        if model not in self.data:
+            raise Fault(2, f"Object {model} doesn't exist")
+        handler = getattr(self, f"_{method}", None)
+        if handler is None:
+            raise Fault(2, f"Method {method} isn't supported")
+        return handler(self.data[model], args, kwargs)
+
+    def _select(self, records: List[Dict], domain: List, kwargs: Dict) -> List[Dict]:
+        selected = sort_records(
+            [r for r in records if matches(r, domain)], kwargs.get("order")
+        )
+        selected = selected[kwargs.get("offset", 0) :]
+        if kwargs.get("limit"):
+            selected = selected[: kwargs["limit"]]
+        return selected
+
+    @staticmethod
+    def _project(record: Dict, fields: Optional[List[str]]) -> Dict:
+        if not fields:
+            return dict(record)
+        return {**{f: record.get(f, False) for f in fields}, "id": record["id"]}
+
+    def _search_read(self, records: List[Dict], args: List, kwargs: Dict) -> List:
+        domain = args[0] if args else kwargs.get("domain", [])
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        return [self._project(r, fields) for r in self._select(records, domain, kwargs)]
+
+    def _search(self, records: List[Dict], args: List, kwargs: Dict) -> List[int]:
+        return [r["id"] for r in self._select(records, args[0], kwargs)]
+
+    def _search_count(self, records: List[Dict], args: List, kwargs: Dict) -> int:
+        return len([r for r in records if matches(r, args[0])])
+
+    def _read(self, records: List[Dict], args: List, kwargs: Dict) -> List:
+        fields = args[1] if len(args) > 1 else kwargs.get("fields")
+        by_id = {record["id"]: record for record in records}
+        return [self._project(by_id[i], fields) for i in args[0] if i in by_id]
+
+    def _fields_get(self, records: List[Dict], args: List, kwargs: Dict) -> Dict:
+        sample = records[0] if records else {}
+        meta = {}
+        for name, value in sample.items():
+            if name.endswith("_date") or name == "date_order":
+                field_type = "datetime"
+            else:
+                field_type = FIELD_TYPES.get(type(value), "char")
+            meta[name] = {"type": field_type, "string": name, "store": True}
+        return meta
+
+    @staticmethod
+    def _group_key(record: Dict, spec: str) -> Any:
+        field, _, granularity = spec.partition(":")
+        value = _value(record.get(field))
+        if granularity and isinstance(value, str):
+            return value[: GRANULARITIES.get(granularity, len(value))]
+        return value
+
+    def _read_group(self, records: List[Dict], args: List, kwargs: Dict) -> List:
+        domain, fields, groupby = args[0], args[1], args[2]
+        groups: Dict[tuple, List[Dict]] = {}
+        for record in records:
+            if matches(record, domain):
+                key = tuple(self._group_key(record, spec) for spec in groupby)
+                groups.setdefault(key, []).append(record)
+        rows = []
+        for key, members in groups.items():
+            row = dict(zip(groupby, key))
+            row["__count"] = len(members)
+            for spec in fields:
+                alias, _, expression = spec.partition(":")
+                source = expression[expression.find("(") + 1 : -1] or alias
+                values = [_value(m.get(source)) or 0 for m in members]
+                row[alias] = AGGREGATES[expression.split("(")[0] or "sum"](values)
+            rows.append(row)
+        return rows
+
+    # Serving
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8069) -> "FakeOdoo":
+        """Start serving in a background thread; port 0 picks a free port."""
+        server = _Server((host, port), _Handler, allow_none=True, logRequests=False)
+        server.register_function(self.authenticate, "authenticate")
+        server.register_function(self.version, "version")
+        server.register_function(self.execute_kw, "execute_kw")
+        self._server = server
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class _Handler(SimpleXMLRPCRequestHandler):
+    rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+    # Keep-alive, like Odoo behind a reverse proxy.
+    protocol_version = "HTTP/1.1"
+
+
+class _Server(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8069)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    odoo = FakeOdoo(args.records, args.latency, args.jitter, args.seed)
+    odoo.serve(args.host, args.port)
+    print(f"Fake Odoo listening on {odoo.url} with {args.records} records per model")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        odoo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Load test against a local fake Odoo.
+
+Starts the fake Odoo XML-RPC server and the API under uvicorn, then runs
+one phase per endpoint: a fixed number of concurrent clients send requests
+for a given duration. Each phase reports the latency percentiles,
+throughput, errors and the upstream Odoo calls it caused. The app is
+configured from the environment as usual, so for example
+``CACHE_ENABLED=false`` benchmarks the uncached path.
+
+Example:
+    python -m benchmarks.load --records 1000 --latency 0.02 --jitter 0.005 \\
+        --concurrency 20 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import uvicorn
+
+from benchmarks.fake_odoo import FakeOdoo
+
+# Endpoint templates; ``{id}`` is replaced by a random record id.
+ENDPOINTS = [
+    "/partners?limit=50",
+    "/partners/{id}",
+    "/products?limit=50",
+    "/products/{id}",
+    "/products?limit=50&filter=list_price>100&order=list_price desc",
+    "/sales?limit=20",
+    "/sales/{id}",
+    "/sales?limit=20&expand=partner,product",
+    "/aggregates/sales?groupby=state&measures=amount_total:sum",
+    "/search/products?q=Product 1",
+]
+
+
+@dataclass
+class PhaseResult:
+    """Measurements of one endpoint."""
+
+    endpoint: str
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+    upstream: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + sum(self.errors.values())
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the successful requests, in milliseconds."""
+        if not self.latencies:
+            return float("nan")
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1000
+
+    def summary(self) -> Dict[str, Any]:
+        requests = self.requests or 1
+        return {
+            "endpoint": self.endpoint,
+            "requests": self.requests,
+            "errors": dict(self.errors),
+            "throughput": round(self.requests / self.elapsed, 1),
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "upstream_per_request": round(sum(self.upstream.values()) / requests, 3),
+            "upstream": {
+                call: round(count / requests, 3)
+                for call, count in sorted(self.upstream.items())
+            },
+        }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_api(port: int) -> uvicorn.Server:
+    """Serve the app in a background thread; import it only once configured."""
+    from app.main import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    make_path: Callable[[str], str],
+    concurrency: int,
+    duration: float,
+) -> PhaseResult:
+    """Keep ``concurrency`` requests to one endpoint in flight for ``duration``."""
+    result = PhaseResult(endpoint)
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                response = await client.get(make_path(endpoint))
+            except httpx.HTTPError as exc:
+                result.errors[type(exc).__name__] += 1
+                continue
+            if response.status_code >= 400:
+                result.errors[str(response.status_code)] += 1
+            else:
+                result.latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def run(args: argparse.Namespace, odoo: FakeOdoo, base_url: str) -> List:
+    rng = random.Random(args.seed)
+
+    def make_path(endpoint: str) -> str:
+        return endpoint.replace("{id}", str(rng.randint(1, args.records)))
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60.0
+    ) as client:
+        response = await client.post(
+            "/token", data={"username": "benchmark", "password": "benchmark"}
+        )
+        response.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        results = []
+        for endpoint in args.endpoint or ENDPOINTS:
+            if args.warmup:
+                await run_phase(
+                    client, endpoint, make_path, args.concurrency, args.warmup
+                )
+            odoo.reset_calls()
+            result = await run_phase(
+                client, endpoint, make_path, args.concurrency, args.duration
+            )
+            result.upstream = dict(odoo.calls)
+            results.append(result.summary())
+            print_row(results[-1])
+        return results
+
+
+def print_header():
+    print(
+        f"{'endpoint':<62} {'reqs':>6} {'err':>5} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'odoo/req':>9}"
+    )
+
+
+def print_row(row: Dict[str, Any]):
+    print(
+        f"{row['endpoint'][:62]:<62} {row['requests']:>6} "
+        f"{sum(row['errors'].values()):>5} {row['throughput']:>8} "
+        f"{row['p50_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8} "
+        f"{row['upstream_per_request']:>9}"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds per call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds per phase")
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        help="endpoint to benchmark, e.g. '/products/{id}'; repeatable",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    odoo = FakeOdoo(args.records, args.latency, args.jitter, args.seed).serve(port=0)
+    os.environ.update(
+        {
+            "ODOO_URL": odoo.url,
+            "ODOO_DB": "benchmark",
+            "ODOO_USERNAME": "benchmark",
+            "ODOO_PASSWORD": "benchmark",
+        }
+    )
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+    port = free_port()
+    server = start_api(port)
+    try:
+        from app.core.config import settings
+
+        print_header()
+        results = asyncio.run(
+            run(args, odoo, f"http://127.0.0.1:{port}{settings.api_v1_prefix}")
+        )
+    finally:
+        server.should_exit = True
+        odoo.close()
+
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Serialization benchmark.
+
+Measures the per-row cost of turning Odoo records into a JSON response body,
+comparing FastAPI's default ``response_model`` path with the precompiled
+TypeAdapter fast path enabled by ``FAST_SERIALIZATION`` and the
+``format=columnar`` layout, along with the size of the columnar body.
+
+Example:
+    python -m benchmarks.serialization --rows 1000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+# The app reads its settings at import time; the benchmark never calls Odoo.
+for name in ("ODOO_URL", "ODOO_DB", "ODOO_USERNAME", "ODOO_PASSWORD", "SECRET_KEY"):
+    os.environ.setdefault(name, "benchmark")
+
+from fastapi import Request, Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.formats import ResponseFormat  # noqa: E402
+from app.core.responses import render  # noqa: E402
+from app.schemas import Partner, Product, SaleOrder  # noqa: E402
+
+
+def make_rows(kind: str, count: int) -> List[Dict[str, Any]]:
+    """Build records shaped like Odoo search_read results."""
+    if kind == "partners":
+        return [
+            {
+                "id": i,
+                "name": f"Partner {i}",
+                "email": f"p{i}@example.com",
+                "phone": "+48 123",
+            }
+            for i in range(1, count + 1)
+        ]
+    if kind == "products":
+        return [
+            {
+                "id": i,
+                "name": f"Product {i}",
+                "list_price": i * 1.5,
+                "default_code": f"SKU{i}" if i % 3 else False,
+            }
+            for i in range(1, count + 1)
+        ]
+    return [
+        {
+            "id": i,
+            "name": f"S{i:05d}",
+            "date_order": "2025-01-02 10:00:00",
+            "partner_id": [i, f"Partner {i}"],
+            "amount_total": i * 10.0,
+            "state": "sale",
+            "invoice_status": "to invoice",
+            "order_lines": [
+                {
+                    "product_id": [j, f"Product {j}"],
+                    "product_uom_qty": 1.0,
+                    "price_unit": 5.0,
+                    "price_subtotal": 5.0,
+                }
+                for j in range(3)
+            ],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+MODELS = {"partners": Partner, "products": Product, "sales": SaleOrder}
+
+
+def default_path(model: Any) -> Callable[[List[Dict[str, Any]]], bytes]:
+    """
+    FastAPI's response_model validation plus JSONResponse encoding.
+
+    Unset fields are excluded as on the sales routes, which leave out the
+    expansions that weren't requested; records read from Odoo set every
+    other field.
+    """
+    field = create_response_field(name="response", type_=List[model])
+
+    def run(rows: List[Dict[str, Any]]) -> bytes:
+        content = asyncio.run(
+            serialize_response(field=field, response_content=rows, exclude_unset=True)
+        )
+        return JSONResponse(content).body
+
+    return run
+
+
+def fast_path(model: Any) -> Callable[[List[Dict[str, Any]]], bytes]:
+    """Precompiled TypeAdapter validation and pydantic-core JSON encoding."""
+    settings.fast_serialization = True
+
+    def run(rows: List[Dict[str, Any]]) -> bytes:
+        return render(rows, List[model]).body
+
+    return run
+
+
+def columnar_path(model: Any) -> Callable[[List[Dict[str, Any]]], bytes]:
+    """Column names once plus one array of values per record."""
+    output = ResponseFormat(Request({"type": "http", "headers": []}), "columnar")
+
+    def run(rows: List[Dict[str, Any]]) -> bytes:
+        return output.render(rows, List[model], Response()).body
+
+    return run
+
+
+def measure(func: Callable, rows: List[Dict[str, Any]], repeat: int) -> float:
+    """Return the best per-row time in microseconds."""
+    func(rows)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    return best / len(rows) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'resource':<10} {'default us/row':>15} {'fast us/row':>12} {'speedup':>8} "
+        f"{'columnar us/row':>16} {'columnar size':>14}"
+    )
+    for kind, model in MODELS.items():
+        rows = make_rows(kind, args.rows)
+        default = default_path(model)
+        fast = fast_path(model)
+        columnar = columnar_path(model)
+        assert default(rows) == fast(rows), "fast path output differs"
+        before = measure(default, rows, args.repeat)
+        after = measure(fast, rows, args.repeat)
+        columns = measure(columnar, rows, args.repeat)
+        size = len(columnar(rows)) / len(fast(rows))
+        print(
+            f"{kind:<10} {before:>15.2f} {after:>12.2f} {before / after:>7.1f}x "
+            f"{columns:>16.2f} {size:>13.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
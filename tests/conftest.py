@@ -0,0 +1,29 @@
+"""Shared fixtures; the app is configured without a reachable Odoo."""
+
+import os
+
+for name in ("ODOO_URL", "ODOO_DB", "ODOO_USERNAME", "ODOO_PASSWORD", "SECRET_KEY"):
+    os.environ.setdefault(name, "test")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+
+from app.core.security import get_current_user  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    """Client of the app, in process, with authentication bypassed."""
+    app.dependency_overrides[get_current_user] = lambda: "test"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test/api/v1"
+    ) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
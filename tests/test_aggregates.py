@@ -0,0 +1,13 @@
+"""Tests of the aggregate endpoints."""
+
+import pytest
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("limit", [0, -1, 1001])
+async def test_group_limit_is_validated(client, limit):
+    response = await client.get(
+        "/aggregates/sales", params={"groupby": "state", "limit": limit}
+    )
+
+    assert response.status_code == 422
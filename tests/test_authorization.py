@@ -0,0 +1,77 @@
+"""Tests of the authentication endpoints."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints import authorization
+from app.core.ratelimit import SlidingWindowLimiter
+from app.core.security import CredentialCache
+
+
+@pytest.mark.anyio
+async def test_login_keeps_odoo_timeouts(client, monkeypatch):
+    async def authenticate(username, password):
+        raise HTTPException(status_code=504, detail="Odoo request timed out")
+
+    monkeypatch.setattr(authorization.odoo, "authenticate", authenticate)
+
+    response = await client.post("/token", data={"username": "u", "password": "p"})
+
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Odoo request timed out"}
+
+
+@pytest.mark.anyio
+async def test_login_rejects_wrong_credentials(client, monkeypatch):
+    async def authenticate(username, password):
+        raise HTTPException(status_code=401, detail="Authentication failed")
+
+    monkeypatch.setattr(authorization.odoo, "authenticate", authenticate)
+
+    response = await client.post("/token", data={"username": "u", "password": "p"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Incorrect username or password"}
+
+
+@pytest.mark.anyio
+async def test_blocked_logins_dont_count_against_other_limits(client, monkeypatch):
+    async def authenticate(username, password):
+        raise HTTPException(status_code=401, detail="Authentication failed")
+
+    monkeypatch.setattr(authorization.odoo, "authenticate", authenticate)
+    monkeypatch.setattr(
+        authorization, "user_login_limiter", SlidingWindowLimiter(limit=5, window=60)
+    )
+    monkeypatch.setattr(
+        authorization, "ip_login_limiter", SlidingWindowLimiter(limit=1, window=60)
+    )
+
+    statuses = []
+    for _ in range(3):
+        response = await client.post("/token", data={"username": "u", "password": "p"})
+        statuses.append(response.status_code)
+
+    assert statuses == [401, 429, 429]
+    assert len(authorization.user_login_limiter._hits["u"]) == 1
+
+
+@pytest.mark.anyio
+async def test_cached_login_skips_odoo(client, monkeypatch):
+    calls = []
+
+    async def authenticate(username, password):
+        calls.append(username)
+        if password != "right":
+            raise HTTPException(status_code=401, detail="Authentication failed")
+        return True
+
+    monkeypatch.setattr(authorization.odoo, "authenticate", authenticate)
+    monkeypatch.setattr(
+        authorization, "credential_cache", CredentialCache(ttl=60, max_size=10)
+    )
+
+    for password in ("right", "right", "wrong"):
+        await client.post("/token", data={"username": "c", "password": password})
+
+    assert calls == ["c", "c"]
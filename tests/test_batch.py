@@ -0,0 +1,30 @@
+"""Tests of the POST /batch endpoint."""
+
+import pytest
+
+from app.api.v1.endpoints import partners, products
+
+
+@pytest.mark.anyio
+async def test_failing_sub_request_only_fails_its_result(client, monkeypatch):
+    async def fetch_partners(**kwargs):
+        # Fails response validation, raising out of the endpoint
+        return [{"id": 1, "name": "Azure", "email": "not an email"}]
+
+    async def fetch_products(**kwargs):
+        return [{"id": 2, "name": "Desk", "list_price": 10.0, "default_code": "D2"}]
+
+    monkeypatch.setattr(partners, "fetch_records", fetch_partners)
+    monkeypatch.setattr(products, "fetch_records", fetch_products)
+
+    response = await client.post(
+        "/batch",
+        json={"requests": [{"path": "/partners/1"}, {"path": "/products/2"}]},
+    )
+
+    assert response.status_code == 200
+    failed, succeeded = response.json()
+    assert failed["status"] == 500
+    assert failed["body"] == {"detail": "Internal Server Error"}
+    assert succeeded["status"] == 200
+    assert succeeded["body"]["name"] == "Desk"
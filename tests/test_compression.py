@@ -0,0 +1,152 @@
+"""Tests of response compression."""
+
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from starlette.responses import Response, StreamingResponse
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate
+
+PREFERRED = ["zstd", "br", "gzip"]
+
+
+@pytest.fixture
+def all_codings(monkeypatch):
+    """Make every coding available, whether or not its package is installed."""
+    encoders = {coding: None for coding in PREFERRED}
+    monkeypatch.setattr(compression, "ENCODERS", encoders)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, coding",
+    [
+        ("", None),
+        ("gzip", "gzip"),
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, br;q=0.8", "gzip"),
+        ("zstd;q=0.5, br;q=0.9, gzip;q=0.1", "br"),
+        ("zstd;q=0, *;q=0.5", "br"),
+        ("gzip;q=0", None),
+        ("identity;q=0", None),
+        ("identity;q=0, gzip;q=0.2", "gzip"),
+        ("GZIP;Q=0.5", "gzip"),
+        ("gzip;q=oops", None),
+    ],
+)
+def test_negotiate_picks_the_highest_q_value(all_codings, accept_encoding, coding):
+    assert negotiate(accept_encoding, PREFERRED) == coding
+
+
+def test_negotiate_skips_unavailable_codings(monkeypatch):
+    monkeypatch.setattr(compression, "ENCODERS", {"gzip": None})
+
+    assert negotiate("zstd, br, gzip;q=0.1", PREFERRED) == "gzip"
+    assert negotiate("zstd, br", PREFERRED) is None
+
+
+async def call(app, accept_encoding="gzip"):
+    """Run a request through the middleware and return the messages it sends."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    messages = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response is sent.
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    await CompressionMiddleware(app)(scope, receive, send)
+    return messages
+
+
+def headers(start):
+    return {name.decode(): value.decode() for name, value in start["headers"]}
+
+
+@pytest.mark.anyio
+async def test_small_bodies_are_sent_as_is():
+    body = b'{"id": 1}'
+
+    start, message = await call(Response(body, media_type="application/json"))
+
+    assert "content-encoding" not in headers(start)
+    assert message["body"] == body
+
+
+@pytest.mark.anyio
+async def test_large_bodies_are_compressed():
+    body = b'{"name": "Desk"}' * 200
+    app = Response(body, media_type="application/json", headers={"ETag": '"abc"'})
+
+    start, message = await call(app)
+
+    sent = headers(start)
+    assert sent["content-encoding"] == "gzip"
+    assert sent["content-length"] == str(len(message["body"]))
+    assert sent["vary"] == "Accept-Encoding"
+    assert sent["etag"] == 'W/"abc"'
+    assert gzip.decompress(message["body"]) == body
+
+
+@pytest.mark.anyio
+async def test_bodies_are_sent_as_is_without_an_accepted_coding():
+    body = b'{"name": "Desk"}' * 200
+
+    start, message = await call(
+        Response(body, media_type="application/json"), accept_encoding="identity"
+    )
+
+    assert "content-encoding" not in headers(start)
+    assert message["body"] == body
+
+
+@pytest.mark.anyio
+async def test_streams_are_compressed_chunk_by_chunk():
+    chunks = [b'{"id": %d, "name": "Desk"}\n' % i for i in range(3)]
+
+    async def rows():
+        for chunk in chunks:
+            yield chunk
+
+    start, *messages = await call(
+        StreamingResponse(rows(), media_type="application/x-ndjson")
+    )
+
+    sent = headers(start)
+    assert sent["content-encoding"] == "gzip"
+    assert "content-length" not in sent
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    # Each chunk decodes on arrival, before the stream ends.
+    for chunk, message in zip(chunks, messages):
+        assert decoder.decompress(message["body"]) == chunk
+    assert messages[-1]["more_body"] is False
+    assert decoder.decompress(messages[-1]["body"]) + decoder.flush() == b""
+    assert decoder.eof
+
+
+@pytest.mark.anyio
+async def test_event_streams_are_never_compressed():
+    events = [b"data: %d\n\n" % i * 200 for i in range(2)]
+
+    async def stream():
+        for event in events:
+            yield event
+
+    start, *messages = await call(
+        StreamingResponse(stream(), media_type="text/event-stream")
+    )
+
+    assert "content-encoding" not in headers(start)
+    assert [message["body"] for message in messages if message["body"]] == events
@@ -0,0 +1,11 @@
+"""Tests of the export encoders."""
+
+from app.api.v1.endpoints.export import csv_rows
+
+
+def test_csv_rows_keep_zeros_and_blank_empty_values():
+    records = [{"id": 1, "qty": 0, "price": 0.0, "code": False, "note": None}]
+
+    rows = csv_rows(records, ["id", "qty", "price", "code", "note"])
+
+    assert rows == [[1, 0, 0.0, "", ""]]
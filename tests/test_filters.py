@@ -0,0 +1,22 @@
+"""Tests of the filtering query language."""
+
+import pytest
+
+from app.core.filters import parse_filter
+
+META = {"default_code": {"type": "char"}}
+
+
+@pytest.mark.parametrize(
+    "expression, operand",
+    [
+        ("default_code~A_1", "A\\_1"),
+        ("default_code~100%", "100\\%"),
+        ("default_code!~C:\\temp", "C:\\\\temp"),
+        ("default_code~ABC", "ABC"),
+    ],
+)
+def test_contains_takes_wildcards_literally(expression, operand):
+    [(field, _, value)] = parse_filter(expression, ["default_code"], META)
+
+    assert (field, value) == ("default_code", operand)
@@ -0,0 +1,27 @@
+"""Tests of the columnar response layouts."""
+
+import pytest
+
+from app.core.formats import MEDIA_TYPES, _accepted_layout
+
+COLUMNAR = MEDIA_TYPES["columnar"]
+COLUMNS = MEDIA_TYPES["columns"]
+
+
+@pytest.mark.parametrize(
+    "accept, layout",
+    [
+        ("", None),
+        ("*/*", None),
+        (COLUMNAR, "columnar"),
+        (f"application/json, {COLUMNAR}", None),
+        (f"application/json;q=0.5, {COLUMNAR}", "columnar"),
+        (f"{COLUMNAR};q=0.5, application/json", None),
+        (f"{COLUMNAR};q=0.5, */*;q=0.1", "columnar"),
+        (f"{COLUMNAR};q=0.5, application/*;q=0.9, */*;q=0.1", None),
+        (f"{COLUMNAR};q=0.5, {COLUMNS};q=0.8", "columns"),
+        (f"{COLUMNAR};q=0", None),
+    ],
+)
+def test_accepted_layout_compares_q_values(accept, layout):
+    assert _accepted_layout(accept) == layout
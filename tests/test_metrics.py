@@ -0,0 +1,22 @@
+"""Tests of the request instrumentation."""
+
+import pytest
+
+from app.api.v1.endpoints import products
+
+
+@pytest.mark.anyio
+async def test_server_timing_covers_default_serialization(client, monkeypatch):
+    async def fetch_products(**kwargs):
+        return [{"id": 2, "name": "Desk", "list_price": 10.0, "default_code": "D2"}]
+
+    monkeypatch.setattr(products, "fetch_records", fetch_products)
+
+    response = await client.get("/products/2")
+
+    assert response.status_code == 200
+    phases = [
+        entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")
+    ]
+    assert "validate" in phases
+    assert "encode" in phases
@@ -0,0 +1,117 @@
+"""Tests of keyset pagination."""
+
+import operator
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.pagination import fetch_after
+
+OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "=": operator.eq}
+
+
+class MicrosecondOdoo:
+    """
+    Records whose ``write_date`` has microseconds, like Odoo's column.
+
+    Domains compare against the stored value, but reads return it truncated
+    to the second, as Odoo does.
+    """
+
+    def __init__(self, stamps):
+        self.records = [
+            {"id": record_id, "write_date": stamp} for record_id, stamp in stamps
+        ]
+
+    @staticmethod
+    def _stored(record, field):
+        value = record[field]
+        return (
+            value.strftime("%Y-%m-%d %H:%M:%S.%f") if field == "write_date" else value
+        )
+
+    async def fetch(self, domain, limit, order):
+        def matches(record):
+            return all(
+                OPERATORS[op](self._stored(record, field), value)
+                for field, op, value in domain
+            )
+
+        if order == "id asc":
+            key = lambda record: record["id"]  # noqa: E731
+        else:
+            key = lambda record: (record["write_date"], record["id"])  # noqa: E731
+        selected = sorted(filter(matches, self.records), key=key)[: limit or None]
+        return [
+            {
+                "id": record["id"],
+                "write_date": record["write_date"].strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            for record in selected
+        ]
+
+
+def make_stamps(count_per_second, seconds, seed=0):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    ids = list(range(1, count_per_second * seconds + 1))
+    rng.shuffle(ids)
+    return [
+        (
+            ids.pop(),
+            start + timedelta(seconds=second, microseconds=rng.randrange(1_000_000)),
+        )
+        for second in range(seconds)
+        for _ in range(count_per_second)
+    ]
+
+
+async def read_all(odoo, limit):
+    seen, after, calls = [], None, 0
+    while True:
+        records, after, has_more = await fetch_after(
+            odoo.fetch, [], "write_date", after, limit
+        )
+        seen += [record["id"] for record in records]
+        calls += 1
+        assert calls < 1000, "pagination doesn't terminate"
+        if not has_more:
+            return seen
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("limit", [1, 3, 7, 50])
+async def test_write_date_pages_return_each_record_once(limit):
+    odoo = MicrosecondOdoo(make_stamps(count_per_second=12, seconds=4))
+
+    seen = await read_all(odoo, limit)
+
+    assert sorted(seen) == sorted(record["id"] for record in odoo.records)
+
+
+@pytest.mark.anyio
+async def test_write_date_pages_progress_within_one_transaction():
+    # More records than the page size sharing one write_date
+    stamp = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    odoo = MicrosecondOdoo([(record_id, stamp) for record_id in range(1, 26)])
+
+    seen = await read_all(odoo, limit=10)
+
+    assert seen == list(range(1, 26))
+
+
+@pytest.mark.anyio
+async def test_write_date_position_resumes_after_new_writes():
+    odoo = MicrosecondOdoo(make_stamps(count_per_second=3, seconds=2))
+    _, after, has_more = await fetch_after(odoo.fetch, [], "write_date", None, 100)
+    assert not has_more
+
+    records, _, _ = await fetch_after(odoo.fetch, [], "write_date", after, 100)
+    assert records == []
+
+    odoo.records.append(
+        {"id": 99, "write_date": datetime(2024, 1, 1, 12, 0, 1, 999999)}
+    )
+    records, _, _ = await fetch_after(odoo.fetch, [], "write_date", after, 100)
+    assert [record["id"] for record in records] == [99]
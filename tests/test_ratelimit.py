@@ -0,0 +1,28 @@
+"""Tests of the in-process rate limiting."""
+
+from app.core.ratelimit import SlidingWindowLimiter
+
+
+def test_checks_beyond_max_keys_dont_track_keys():
+    limiter = SlidingWindowLimiter(limit=1, window=60, max_keys=2)
+
+    for key in "abcde":
+        assert limiter.check(key) is None
+
+    assert limiter._hits == {}
+
+
+def test_hits_beyond_max_keys_prune_expired_keys(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("app.core.ratelimit.time.monotonic", lambda: now[0])
+    limiter = SlidingWindowLimiter(limit=1, window=60, max_keys=2)
+    assert limiter.hit("a") is None
+    assert limiter.hit("b") is None
+
+    now[0] = 61.0
+    # Expires the hits of "a", leaving it tracked with an empty window.
+    assert limiter.check("a") is None
+    assert limiter.hit("c") is None
+
+    assert set(limiter._hits) == {"c"}
+    assert limiter.hit("c") == 60.0
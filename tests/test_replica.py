@@ -0,0 +1,118 @@
+"""Tests of the local read replica."""
+
+import asyncio
+import operator
+import time
+
+import pytest
+
+from app.core.constants import PARTNER_FIELDS
+from app.services import replica as replica_module
+from app.services.replica import SYNC_DOMAIN, Replica
+
+OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "=": operator.eq}
+
+
+def partner(**values):
+    return {**dict.fromkeys(PARTNER_FIELDS, False), **values}
+
+
+@pytest.fixture
+def replica():
+    replica = Replica()
+    replica._open()
+    # Search as on a SQLite built without FTS5.
+    replica.fts = False
+    records = [
+        partner(id=1, name="Desk", email="desk@example.com"),
+        partner(id=2, name="100% Cotton", email=False),
+        partner(id=3, name="Lamp_2", email="lamp@example.com"),
+        partner(id=4, name="Lamp 2", email=False),
+    ]
+    replica._store(
+        "res.partner", records, {"id": 4, "write_date": "2024-01-01 00:00:00"}
+    )
+    replica._synced_at["res.partner"] = time.monotonic()
+    replica._reconciled_at["res.partner"] = time.monotonic()
+    return replica
+
+
+def ids(records):
+    return [record["id"] for record in records]
+
+
+@pytest.mark.anyio
+async def test_like_search_matches_search_fields_only(replica):
+    assert ids(await replica.search("res.partner", "desk", 10)) == [1]
+    assert ids(await replica.search("res.partner", "example", 10)) == [1, 3]
+    assert await replica.search("res.partner", "name", 10) == []
+    assert await replica.search("res.partner", "false", 10) == []
+
+
+@pytest.mark.anyio
+async def test_like_search_takes_wildcards_literally(replica):
+    assert ids(await replica.search("res.partner", "100%", 10)) == [2]
+    assert ids(await replica.search("res.partner", "%", 10)) == [2]
+    assert ids(await replica.search("res.partner", "Lamp_", 10)) == [3]
+
+
+@pytest.mark.anyio
+async def test_search_waits_for_sync_off_the_event_loop(replica):
+    # Held as by a sync writing a batch on a worker thread.
+    replica._lock.acquire()
+    try:
+        search = asyncio.ensure_future(replica.search("res.partner", "desk", 10))
+        await asyncio.sleep(0.05)
+        assert not search.done()
+    finally:
+        replica._lock.release()
+
+    assert ids(await search) == [1]
+
+
+@pytest.mark.anyio
+async def test_sync_drops_archived_records(replica, monkeypatch):
+    records = [
+        partner(id=1, name="Desk", write_date="2024-01-01 00:00:01", active=False),
+        partner(id=5, name="Chair", write_date="2024-01-01 00:00:02", active=True),
+    ]
+
+    async def fetch_records(model, domain, fields, limit, order, use_cache):
+        assert domain[:3] == SYNC_DOMAIN and "active" in fields
+        conditions = [term for term in domain[3:] if term != "|"]
+        selected = [
+            record
+            for record in records
+            if all(OPERATORS[op](record[f], value) for f, op, value in conditions)
+        ]
+        key = (lambda r: r["id"]) if order == "id asc" else (lambda r: r["write_date"])
+        return sorted(selected, key=key)[:limit]
+
+    monkeypatch.setattr(replica_module.odoo, "fetch_records", fetch_records)
+
+    await replica.sync("res.partner")
+
+    assert await replica.read("res.partner", [("id", "=", 1)], ["name"], 1, None) == []
+    assert ids(await replica.search("res.partner", "chair", 10)) == [5]
+    assert await replica.search("res.partner", "desk", 10) == []
+
+
+def test_reads_need_a_recent_scan_for_deletions(replica):
+    assert replica.is_fresh("res.partner")
+
+    replica._reconciled_at["res.partner"] -= replica.max_staleness + 1
+
+    assert not replica.is_fresh("res.partner")
+
+
+def test_deletion_scans_keep_up_with_max_staleness(replica):
+    replica.sync_interval, replica.max_staleness = 10, 60
+    replica.reconcile_every = 30
+    now = time.monotonic()
+
+    replica._reconciled_at["res.partner"] = now - 45
+    assert not replica._reconcile_due("res.partner", rounds=1)
+
+    replica._reconciled_at["res.partner"] = now - 55
+    assert replica._reconcile_due("res.partner", rounds=1)
+    assert replica._reconcile_due("res.partner", rounds=30)
@@ -0,0 +1,38 @@
+"""Tests of response rendering."""
+
+import json
+from typing import List
+
+from app.core.responses import (
+    SPARSE_ADAPTER_CACHE_SIZE,
+    _sparse_adapter,
+    get_adapter,
+    render,
+    response_adapter,
+)
+from app.schemas import Partner
+
+
+def test_field_selections_share_a_bounded_adapter_cache():
+    _sparse_adapter.cache_clear()
+    static_adapters = get_adapter.cache_info().currsize
+
+    first = response_adapter(List[Partner], ["name", "email"])
+    second = response_adapter(List[Partner], ["email", "name", "email"])
+    assert first is second
+    assert _sparse_adapter.cache_info().currsize == 1
+
+    for i in range(SPARSE_ADAPTER_CACHE_SIZE + 10):
+        response_adapter(List[Partner], [f"field_{i}"])
+    assert _sparse_adapter.cache_info().currsize == SPARSE_ADAPTER_CACHE_SIZE
+    assert get_adapter.cache_info().currsize == static_adapters
+
+
+def test_sparse_render_leaves_out_unselected_fields():
+    records = [{"id": 1, "name": "Azure", "email": "azure@example.com"}]
+
+    response = render(records, List[Partner], fields=["email", "name"])
+
+    assert json.loads(response.body) == [
+        {"name": "Azure", "email": "azure@example.com", "id": 1}
+    ]
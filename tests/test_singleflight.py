@@ -0,0 +1,123 @@
+"""Tests of the coalescing of identical concurrent calls."""
+
+import asyncio
+
+import pytest
+
+from app.services.odoo import odoo
+from app.services.singleflight import SingleFlight
+
+
+class SlowCall:
+    """A call that completes when released, counting how often it's started."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.started = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.started += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.anyio
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    call = SlowCall(result=[{"id": 1, "tags": ["a"]}])
+
+    waiters = [asyncio.ensure_future(flight.do("key", call)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert flight.stats() == {"in_flight": 1, "calls": 1, "shared": 2}
+    call.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert call.started == 1
+    assert all(result == [{"id": 1, "tags": ["a"]}] for result in results)
+    # Every waiter gets its own copy to mutate.
+    assert len({id(result) for result in results}) == 3
+    assert len({id(result[0]["tags"]) for result in results}) == 3
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_different_keys_dont_share():
+    flight = SingleFlight()
+    first, second = SlowCall(result=1), SlowCall(result=2)
+
+    waiters = [
+        asyncio.ensure_future(flight.do("first", first)),
+        asyncio.ensure_future(flight.do("second", second)),
+    ]
+    first.release.set()
+    second.release.set()
+
+    assert await asyncio.gather(*waiters) == [1, 2]
+    assert (first.started, second.started) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_errors_reach_every_waiter_and_free_the_key():
+    flight = SingleFlight()
+    failing = SlowCall(error=ValueError("boom"))
+
+    waiters = [asyncio.ensure_future(flight.do("key", failing)) for _ in range(2)]
+    await asyncio.sleep(0)
+    failing.release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert failing.started == 1
+
+    retry = SlowCall(result="ok")
+    retry.release.set()
+    assert await flight.do("key", retry) == "ok"
+    assert retry.started == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_leaves_the_call_running():
+    flight = SingleFlight()
+    call = SlowCall(result="ok")
+
+    cancelled = asyncio.ensure_future(flight.do("key", call))
+    waiting = asyncio.ensure_future(flight.do("key", call))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    call.release.set()
+
+    assert await waiting == "ok"
+    assert cancelled.cancelled()
+    assert call.started == 1
+
+
+@pytest.mark.anyio
+async def test_identical_reads_reach_odoo_once(monkeypatch):
+    release = asyncio.Event()
+    calls = []
+
+    async def execute_kw(model, method, args, kwargs=None):
+        calls.append((model, method))
+        await release.wait()
+        return [{"id": 1, "name": "Desk"}]
+
+    monkeypatch.setattr(odoo, "execute_kw", execute_kw)
+
+    reads = [
+        asyncio.ensure_future(
+            odoo.fetch_records(
+                "product.template", [("id", "=", 1)], ["name"], use_cache=False
+            )
+        )
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*reads) == [[{"id": 1, "name": "Desk"}]] * 5
+    assert calls == [("product.template", "search_read")]